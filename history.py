@@ -1,65 +1,446 @@
 #!/usr/bin/env python3
-# history.py  –  rev-h4  (2025-06-27)
+# history.py  –  rev-h5  (2026-10-15)
 """
 Read / write per-playlist history files.
 
-Schema  (JSON)
---------------
+Schema
+------
 {
   "display_name": "My Road-Trip Mix",   # optional – NEW
   "track_index" : 3,
   "position"    : 17.5,                 # seconds
   "finished"    : ["/path/track1.flac", …]
 }
+On disk "finished" drops the paths' common leading part, which is kept
+once under "finished_prefix"; load() hands back full paths.
+"position" also lives in ``*.history.pos`` (one little-endian double);
+position-only saves touch just that file and load() prefers it.
 All writes are atomic (tmp + replace) and tolerant to partial data.
+Stored as *msgpack* (``*.history.mpk``) when msgpack is installed, else
+as JSON (``*.history.json``, via orjson if available).  An existing JSON
+history is migrated to msgpack the first time it is loaded.
+
+Public API
+──────────
+load(pl) → dict
+save(pl, track_index, position, finished)
+save_throttled(pl, track_index, position, finished, min_interval=2.0)
+flush_pending()
+flush(timeout=None) → bool
+ensure_name(pl, name)
+
+Writes are serialized on the caller's thread and written to disk by a
+single background thread; call flush() where the data must be on disk.
 """
 
 from __future__ import annotations
-import json, tempfile, os, shutil
+import json, os, sys, struct, shutil, threading, atexit
+from functools import lru_cache
 from pathlib import Path
-from typing  import Set, Dict, Any
+from typing  import Dict, Any, Tuple, List, Iterable, Set
+
+__all__ = ["load", "save", "save_throttled", "flush_pending", "flush",
+           "ensure_name"]
+
+try:
+    import orjson
+except ImportError:                         # optional speed-up
+    orjson = None
+try:
+    import msgpack
+except ImportError:                         # optional binary format
+    msgpack = None
+
+def _loads_json(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson else json.loads(raw.decode("utf-8"))
+
+PRETTY_JSON = False      # indent history files (debugging only)
+
+def _dumps_json(data: Any) -> bytes:
+    if orjson:
+        opt = orjson.OPT_SORT_KEYS | (orjson.OPT_INDENT_2 if PRETTY_JSON else 0)
+        return orjson.dumps(data, option=opt)
+    return json.dumps(data, ensure_ascii=False, sort_keys=True,
+                      **({"indent": 2} if PRETTY_JSON
+                         else {"separators": (",", ":")})).encode("utf-8")
 
-BAK_PATH: Path | None = None  # updated by _path()
+if msgpack:
+    def _loads(raw: bytes) -> Any:
+        return msgpack.unpackb(raw, raw=False)
+    def _dumps(data: Any) -> bytes:
+        return msgpack.packb(data, use_bin_type=True)
+    _DECODE_ERRORS = (ValueError, msgpack.UnpackException)
+else:
+    _loads, _dumps = _loads_json, _dumps_json
+    _DECODE_ERRORS = (ValueError,)
+
+def _pack(data: Dict[str, Any]) -> Dict[str, Any]:
+    """On-disk form: factor the shared folder out of "finished" paths."""
+    fin    = data.get("finished")
+    prefix = os.path.commonprefix(fin) if fin else ""
+    prefix = prefix[:max(prefix.rfind("/"), prefix.rfind("\\")) + 1]
+    if not prefix:
+        return data
+    out = dict(data)
+    out["finished_prefix"] = prefix
+    out["finished"]        = [s[len(prefix):] for s in fin]
+    return out
+
+def _unpack(data: Any) -> Any:
+    """Inverse of _pack(); tolerates files written before the prefix."""
+    if isinstance(data, dict) and (prefix := data.pop("finished_prefix", "")):
+        data["finished"] = [prefix + s for s in data.get("finished", [])]
+    return data
+
+JSON_SUFFIX    = ".history.json"
+HISTORY_SUFFIX = ".history.mpk" if msgpack else JSON_SUFFIX
+POS_SUFFIX     = ".history.pos"
+
+# parsed history per file, keyed by history path → (mtime_ns, data)
+_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+# hash of the bytes we last wrote per history path (skip no-op rewrites)
+_LAST_HASH: Dict[Path, int] = {}
+
+# write coalescing for save_throttled()  (all keyed by playlist path)
+_LOCK    = threading.RLock()
+_PENDING: Dict[Path, Tuple[int, float, List[str]]] = {}
+_TIMERS : Dict[Path, threading.Timer] = {}
+_FLUSHED: Dict[Path, Tuple[int, List[str]]] = {}   # last written index/finished
+
+@lru_cache(maxsize=512)
+def _paths(pl: Path) -> Tuple[Path, Path, Path, Path]:
+    """(history, backup, tmp, position sidecar) paths for playlist *pl*."""
+    hist = pl.with_suffix(pl.suffix + HISTORY_SUFFIX)
+    return (hist,
+            hist.with_suffix(hist.suffix + ".bak"),
+            # same directory → same volume; pid keeps two instances apart
+            hist.with_name(f"{hist.name}.tmp.{os.getpid()}"),
+            pl.with_suffix(pl.suffix + POS_SUFFIX))
 
-def _path(pl: Path) -> Path:
-    path = pl.with_suffix(pl.suffix + ".history.json")
-    global BAK_PATH
-    BAK_PATH = path.with_suffix(path.suffix + ".bak")
-    return path
+def _decode(pl: Path, raw: bytes) -> Dict[str, Any]:
+    """Parse one history file; anything but a mapping counts as corrupt."""
+    data = _unpack(_loads(raw))
+    if not isinstance(data, dict):
+        raise ValueError("history payload is not a mapping")
+    return _with_position(pl, data)
 
 def load(pl: Path) -> Dict[str, Any]:
-    p = _path(pl)
+    """Return history for *pl*; re-parsed only when the file's mtime moves.
+
+    A missing or unreadable file yields {}; only a corrupt one (decode
+    error) triggers recovery from the .bak copy.
+    """
+    p, bak, _, _ = _paths(pl)
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
-    except Exception:
-        if BAK_PATH and BAK_PATH.exists():
-            try:
-                data = json.loads(BAK_PATH.read_text(encoding="utf-8"))
-                shutil.copy2(BAK_PATH, p)
-                return data
-            except Exception:
-                pass
+        mtime = p.stat().st_mtime_ns
+        hit   = _CACHE.get(p)
+        if hit and (hit[0] == mtime or _busy(p)):
+            return dict(hit[1])
+        _LAST_HASH.pop(p, None)             # changed behind our back
+        data = _decode(pl, p.read_bytes())
+        _CACHE[p] = (mtime, data)
+        return dict(data)
+    except FileNotFoundError:               # cold playlist / pre-msgpack
+        hit = _CACHE.get(p)
+        if hit and _busy(p):                # first write still queued
+            return dict(hit[1])
+        _CACHE.pop(p, None)
+        _LAST_HASH.pop(p, None)
+        return _migrate_json(pl) if HISTORY_SUFFIX != JSON_SUFFIX else {}
+    except OSError:                         # locked / unreadable
+        _CACHE.pop(p, None)
+        _LAST_HASH.pop(p, None)
+        return {}
+    except _DECODE_ERRORS:                  # corrupt / truncated / not a mapping
+        _CACHE.pop(p, None)
+        _LAST_HASH.pop(p, None)
+    try:
+        data = _decode(pl, bak.read_bytes())
+        shutil.copy2(bak, p)
+        _CACHE[p] = (p.stat().st_mtime_ns, data)
+        return dict(data)
+    except (OSError, ValueError):
         return {}
 
-def _atomic_write(path: Path, data: dict):
-    tmp = path.with_suffix(".tmp")          # same directory → same volume
-    with tmp.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-        f.flush()
-        os.fsync(f.fileno())
-    if path.exists() and BAK_PATH:
-        shutil.copy2(path, BAK_PATH)
-    tmp.replace(path)
+def _migrate_json(pl: Path) -> Dict[str, Any]:
+    """One-shot copy of a legacy *.history.json into the msgpack file."""
+    legacy = pl.with_suffix(pl.suffix + JSON_SUFFIX)
+    try:
+        data = _unpack(_loads_json(legacy.read_bytes()))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    with _LOCK:
+        _atomic_write(pl, dict(data))
+    return data
+
+_TMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+def _fsync_dir(folder: Path):
+    """Persist a rename in *folder* (POSIX only; no-op on Windows)."""
+    if os.name == "nt":
+        return
+    try:
+        fd = os.open(folder, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def _backup(path: Path, bak: Path):
+    """Keep the outgoing file as *bak*: hard link, copy if links fail.
+
+    The following rename swaps a new inode under *path*, so the link
+    keeps the old contents alive without copying any data.
+    """
+    try:
+        os.unlink(bak)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(path, bak)
+    except (OSError, NotImplementedError, AttributeError):
+        shutil.copy2(path, bak)
+
+# Linux ≥ 3.15: renameat2(RENAME_EXCHANGE) swaps tmp and history in one
+# syscall, so the previous file becomes the backup without link/copy.
+_AT_FDCWD, _RENAME_EXCHANGE = -100, 2
+_renameat2 = None
+if sys.platform.startswith("linux"):
+    try:
+        import ctypes
+        _renameat2 = getattr(ctypes.CDLL(None, use_errno=True), "renameat2", None)
+        if _renameat2:
+            _renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p,
+                                   ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+            _renameat2.restype  = ctypes.c_int
+    except (OSError, AttributeError):
+        _renameat2 = None
+
+def _exchange(a: Path, b: Path) -> bool:
+    """Atomically swap *a* and *b*; False if unsupported or *b* is absent."""
+    if _renameat2 is None:
+        return False
+    return _renameat2(_AT_FDCWD, os.fsencode(a),
+                      _AT_FDCWD, os.fsencode(b), _RENAME_EXCHANGE) == 0
+
+def _atomic_write(pl: Path, data: dict):
+    """Queue *data* as the new history of *pl*; returns without disk I/O.
+
+    Serialization happens here, the file write (tmp file and directory
+    fsynced) on the background writer, see _writer_loop.  Position-only
+    updates never get here; they go to the sidecar.  *data* becomes the
+    cached state as-is (normally it already is, see _current()).
+    """
+    path = _paths(pl)[0]
+    buf  = _dumps(_pack(data))
+    h    = hash(buf)
+    if _LAST_HASH.get(path) == h:
+        return                              # identical to what is on disk
+    hit = _CACHE.get(path)
+    _CACHE[path]     = (hit[0] if hit else -1, data)
+    _LAST_HASH[path] = h
+    _enqueue(path, pl, data, buf)
+
+def _write_bytes(pl: Path, data: dict, buf: bytes):
+    path, bak, tmp, _ = _paths(pl)
+    fd = os.open(tmp, _TMP_FLAGS, 0o644)
+    try:
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    if _exchange(tmp, path):                # old contents now sit at tmp
+        os.replace(tmp, bak)
+    else:
+        if path.exists():
+            _backup(path, bak)
+        tmp.replace(path)
+    _fsync_dir(path.parent)
+    with _LOCK:
+        hit = _CACHE.get(path)
+        if hit and hit[1] is data:          # no newer state queued meanwhile
+            _CACHE[path] = (path.stat().st_mtime_ns, data)
+
+# –––––––––––––––––––––––––––––––––––––––––––––––––––––––––
+# Background writer: one thread, latest payload per file wins
+# –––––––––––––––––––––––––––––––––––––––––––––––––––––––––
+_WCOND   = threading.Condition()
+# history path → (playlist, data, payload)
+_WQUEUE : Dict[Path, Tuple[Path, dict, bytes]] = {}
+_WBUSY  : Set[Path] = set()                 # history paths being written
+_WRITER : threading.Thread | None = None
+
+def _enqueue(path: Path, pl: Path, data: dict, buf: bytes):
+    global _WRITER
+    with _WCOND:
+        _WQUEUE.pop(path, None)             # superseded payload is dropped
+        _WQUEUE[path] = (pl, data, buf)
+        if _WRITER is None:
+            _WRITER = threading.Thread(target=_writer_loop,
+                                       name="history-writer", daemon=True)
+            _WRITER.start()
+        _WCOND.notify_all()
+
+def _busy(path: Path) -> bool:
+    """True while a write for history *path* is queued or running."""
+    with _WCOND:
+        return path in _WQUEUE or path in _WBUSY
+
+def _writer_loop():
+    while True:
+        with _WCOND:
+            while not _WQUEUE:
+                _WCOND.wait()
+            path = next(iter(_WQUEUE))
+            pl, data, buf = _WQUEUE.pop(path)
+            _WBUSY.add(path)
+        try:
+            _write_bytes(pl, data, buf)
+        except OSError as e:
+            print("history write failed:", e)
+            _LAST_HASH.pop(path, None)      # retry on next save
+        finally:
+            with _WCOND:
+                _WBUSY.discard(path)
+                _WCOND.notify_all()
+
+def flush(timeout: float | None = None) -> bool:
+    """Block until every queued history write has hit the disk."""
+    with _WCOND:
+        return _WCOND.wait_for(lambda: not _WQUEUE and not _WBUSY, timeout)
+
+def _current(pl: Path) -> Dict[str, Any]:
+    """The cached state dict for *pl*, updated in place by writers.
+
+    Seeded from disk on first use; a playlist without history gets a
+    template with the fixed key layout.  Call with _LOCK held.
+    """
+    path = _paths(pl)[0]
+    hit  = _CACHE.get(path) or (load(pl) and _CACHE.get(path))
+    if hit:
+        return hit[1]
+    data = {"track_index": 0, "position": 0.0, "finished": []}
+    _CACHE[path] = (-1, data)
+    return data
+
+# –––––––––––––––––––––––––––––––––––––––––––––––––––––––––
+# Position sidecar: one little-endian double, rewritten in place
+# –––––––––––––––––––––––––––––––––––––––––––––––––––––––––
+_POS = struct.Struct("<d")
+_POS_FDS: Dict[Path, int] = {}              # playlist → open sidecar fd
+
+def _save_position(pl: Path, position: float):
+    """Store *position* in the sidecar (no JSON, rename or fsync).
+
+    An 8-byte write at offset 0 cannot tear.  Call with _LOCK held.
+    """
+    fd = _POS_FDS.get(pl)
+    try:
+        if fd is None:
+            fd = _POS_FDS[pl] = os.open(_paths(pl)[3],
+                                        os.O_RDWR | os.O_CREAT
+                                        | getattr(os, "O_BINARY", 0), 0o644)
+        buf = _POS.pack(float(position))
+        if hasattr(os, "pwrite"):
+            os.pwrite(fd, buf, 0)
+        else:                               # Windows
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.write(fd, buf)
+    except OSError as e:
+        print("history position write failed:", e)
+
+def _with_position(pl: Path, data: Any) -> Any:
+    """Overlay the sidecar position (newer than the main file) on *data*."""
+    if isinstance(data, dict):
+        try:
+            with open(_paths(pl)[3], "rb") as f:
+                data["position"] = _POS.unpack(f.read(_POS.size))[0]
+        except (OSError, struct.error):
+            pass
+    return data
+
+def _sorted(finished: Iterable[str]) -> List[str]:
+    # a list is taken to be sorted already (player keeps it via bisect)
+    return finished if isinstance(finished, list) else sorted(finished)
 
 def save(pl: Path,
          track_index: int,
          position: float,
-         finished: Set[str]):
-    data           = load(pl)
-    data["track_index"] = track_index
-    data["position"]    = position
-    data["finished"]    = sorted(finished)
-    _atomic_write(_path(pl), data)
+         finished: Iterable[str]):
+    """Write history; pass *finished* as a sorted list to skip sorting."""
+    finished = _sorted(finished)
+    with _LOCK:
+        _PENDING.pop(pl, None)              # superseded by this write
+        t = _TIMERS.pop(pl, None)
+        if t:
+            t.cancel()
+        data           = _current(pl)
+        data["track_index"] = track_index
+        data["position"]    = position
+        data["finished"]    = list(finished)
+        _save_position(pl, position)
+        # position-only → the 8-byte sidecar above is all that changes
+        if _FLUSHED.get(pl) != (track_index, finished):
+            _atomic_write(pl, data)
+            _FLUSHED[pl] = (track_index, data["finished"])
+
+# –––––––––––––––––––––––––––––––––––––––––––––––––––––––––
+# Coalesced writes: position-only updates wait ≤ min_interval
+# –––––––––––––––––––––––––––––––––––––––––––––––––––––––––
+def save_throttled(pl: Path,
+                   track_index: int,
+                   position: float,
+                   finished: Iterable[str],
+                   min_interval: float = 2.0):
+    """Like save(), but coalesce position-only changes (seek storms).
+
+    A new track_index or finished set is written immediately; otherwise
+    the latest values are written once *min_interval* seconds after the
+    first deferred call.  flush_pending() runs at interpreter exit.
+    """
+    finished = _sorted(finished)
+    with _LOCK:
+        if _FLUSHED.get(pl) != (track_index, finished):
+            save(pl, track_index, position, finished)
+            return
+        _PENDING[pl] = (track_index, position, finished)
+        if pl in _TIMERS:
+            return                          # already armed → coalesce
+        t = threading.Timer(min_interval, _flush, args=(pl,))
+        t.daemon = True
+        _TIMERS[pl] = t
+        t.start()
+
+def _flush(pl: Path):
+    with _LOCK:
+        _TIMERS.pop(pl, None)
+        args = _PENDING.pop(pl, None)
+        if args:
+            save(pl, *args)
+
+def flush_pending():
+    """Write every deferred save_throttled() update now."""
+    with _LOCK:
+        for pl in list(_PENDING):
+            _flush(pl)
+
+def _at_exit():
+    flush_pending()
+    flush()
+    with _LOCK:
+        for fd in _POS_FDS.values():
+            os.close(fd)
+        _POS_FDS.clear()
+
+atexit.register(_at_exit)
 
 # –––––––––––––––––––––––––––––––––––––––––––––––––––––––––
 # NEW: persist friendly name so it survives app.state loss
@@ -67,9 +448,9 @@ def save(pl: Path,
 def ensure_name(pl: Path, name: str):
     if not name:
         return
-    p   = _path(pl)
-    dat = load(pl)
-    if dat.get("display_name") == name:
-        return
-    dat["display_name"] = name
-    _atomic_write(p, dat)
+    with _LOCK:
+        dat = _current(pl)
+        if dat.get("display_name") == name:
+            return
+        dat["display_name"] = name
+        _atomic_write(pl, dat)
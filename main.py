@@ -8,14 +8,18 @@ Gap-less playlist player for Windows (PySide6 + libVLC).
 Key features
 • Scan / create / rename / delete playlists (.m3u, .m3u8, .fplite + index.txt)
 • Gap-less playback with DirectSound / WASAPI selector
-• Resume history written every 5 s (or on key events) → *.history.json
-• Friendly *display_name* stored in history.json (survives app.state loss)
+• Resume history written every 5 s (or on key events) → *.history.mpk / .json
+• Friendly *display_name* stored in the history file (survives app.state loss)
 • Embedded cover-art, timeline seek (click / drag / wheel; Ctrl = fine)
 • Custom icon  ▸  Playlist-Player_logo.ico (project root)
 """
 
 from __future__ import annotations
-import sys, os, subprocess, venv, site, hashlib, io, time
+import sys, os, subprocess, venv, site, hashlib, io, time, threading, importlib.util, base64
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain, groupby
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Set
 
@@ -23,11 +27,29 @@ from typing import Dict, List, Optional, Tuple, Set
 APP_DIR  = Path(__file__).parent
 VENV_DIR = APP_DIR / ".venv"
 PYSIDE_REQ = "PySide6>=6.9.0" if sys.version_info >= (3, 13) else "PySide6>=6.7,<6.8"
-REQS = [PYSIDE_REQ, "python-vlc", "mutagen", "pillow", "keyboard"]
+REQS = [PYSIDE_REQ, "python-vlc", "mutagen", "pillow", "keyboard", "xxhash", "orjson", "msgpack"]
+
+VENV_STAMP = VENV_DIR / ".stamp-v1"     # "<REQS hash>\n<site-packages>" after a good setup
+
+def _reqs_hash() -> str:
+    return hashlib.blake2b("\n".join([sys.version, *REQS]).encode(), digest_size=8).hexdigest()
+
+def _venv_path(sp: Path) -> None:
+    site.addsitedir(str(sp))
+    bin_dir, path = str(VENV_DIR/("Scripts" if os.name=="nt" else "bin")), os.environ.get("PATH", "")
+    if not path.startswith(bin_dir + os.pathsep):    # relaunched from a child: already first
+        os.environ["PATH"] = f"{bin_dir}{os.pathsep}{path}"
 
 def _ensure_env() -> None:
     if getattr(sys, "frozen", False):
         return
+    # -------- fast path: venv already set up for these REQS -----
+    try:
+        tag, sp = VENV_STAMP.read_text(encoding="utf-8").split("\n", 1)
+        if tag == _reqs_hash() and Path(sp).is_dir():
+            _venv_path(Path(sp)); return
+    except (OSError, ValueError):
+        pass
     if not VENV_DIR.exists():
         venv.create(VENV_DIR, with_pip=True)
         try:
@@ -44,9 +66,9 @@ def _ensure_env() -> None:
     if os.name == "nt":
         sp = VENV_DIR / "Lib" / "site-packages"
     else:
-        sp = next((VENV_DIR/"lib").glob("python*/site-packages"), None)
-        if sp is None:
-            sp = VENV_DIR / "lib" / f"python{sys.version_info.major}.{sys.version_info.minor}" / "site-packages"
+        sp = VENV_DIR / "lib" / f"python{sys.version_info.major}.{sys.version_info.minor}" / "site-packages"
+        if not sp.is_dir():                         # exotic layout → scan for it
+            sp = next((VENV_DIR/"lib").glob("python*/site-packages"), sp)
     site.addsitedir(str(sp))
 
     # -------- install whatever is still missing -----------------
@@ -54,34 +76,53 @@ def _ensure_env() -> None:
     for pkg, mod in [("mutagen", "mutagen"),
                      ("pillow",  "PIL.Image"),
                      ("python-vlc", "vlc"),
-                     ("keyboard", "keyboard")]:
+                     ("keyboard", "keyboard"),
+                     ("xxhash",  "xxhash"),
+                     ("orjson",  "orjson"),      # history/state: same format as the exe
+                     ("msgpack", "msgpack")]:
         try:
-            __import__(mod)
+            if importlib.util.find_spec(mod) is None:   # locate only, don't import
+                missing.append(pkg)
         except ModuleNotFoundError:
             missing.append(pkg)
 
     if missing:
         pip = VENV_DIR / ("Scripts" if os.name=="nt" else "bin") / "pip"
         subprocess.check_call([str(pip), "install", *missing, "--quiet"])
-        site.addsitedir(str(sp))
-    os.environ["PATH"] = f"{VENV_DIR/('Scripts' if os.name=='nt' else 'bin')}{os.pathsep}{os.environ.get('PATH','')}"
+    _venv_path(sp)
+    try: VENV_STAMP.write_text(f"{_reqs_hash()}\n{sp}", encoding="utf-8")
+    except OSError: pass
 _ensure_env()
 
 # ═════════════════ 1. Qt / extern imports ═════════════════
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QListWidget, QListWidgetItem, QVBoxLayout,
+    QApplication, QWidget, QListWidget, QListView, QVBoxLayout,
     QHBoxLayout, QSplitter, QPushButton, QFileDialog, QInputDialog,
     QLabel, QMessageBox, QFrame, QComboBox, QSlider, QDialog,
-    QDialogButtonBox, QCheckBox, QToolButton
+    QDialogButtonBox, QCheckBox, QToolButton, QStyledItemDelegate
 )
 from PySide6.QtGui    import (
-    QColor, QPalette, QPixmap, QIcon, QDragEnterEvent, QDropEvent
+    QColor, QFont, QPalette, QPixmap, QPixmapCache, QIcon, QDragEnterEvent, QDropEvent,
+    QMouseEvent, QImageReader
+)
+from PySide6.QtCore   import (
+    Qt, QTimer, Signal, QAbstractNativeEventFilter, QMetaObject,
+    QAbstractListModel, QModelIndex, QObject, QRunnable, QThreadPool, QEvent
 )
-from PySide6.QtCore   import Qt, QTimer, Signal, QAbstractNativeEventFilter, QMetaObject
-from mutagen          import File as MFile
+from mutagen          import File as MFile, MutagenError
 from mutagen.id3      import ID3
-from PIL              import Image, ImageFile
+from mutagen.mp3      import MP3, EasyMP3
+from mutagen.flac     import FLAC, Picture
+from mutagen.easymp4  import EasyMP4
+from mutagen.mp4      import MP4, MP4Cover
+from mutagen.oggvorbis import OggVorbis
+from mutagen.oggopus  import OggOpus
+from PIL              import Image, ImageFile, features
 ImageFile.LOAD_TRUNCATED_IMAGES = True
+try:
+    import xxhash                                   # optional: faster art-file names
+except ImportError:
+    xxhash = None
 if os.name == 'nt':
     # The keyboard module is mandatory on Windows for global media hotkeys
     import keyboard
@@ -91,7 +132,7 @@ else:
     except Exception:
         keyboard = None
 
-import scanner, storage, player, history
+import scanner, storage, player, history, tags
 
 # ═════════════════ 2. constants & helpers ═════════════════
 ICON_PATH  = APP_DIR / "Playlist-Player_logo.ico"
@@ -280,6 +321,10 @@ THEMES={"System":None,**THEMES_LIGHT,**THEMES_DARK}
 
 ART_DIR = Path.home()/".playlist-relinker-cache"/"art"; ART_DIR.mkdir(parents=True, exist_ok=True)
 TICKS, MAX_SECONDS = 10, 86_400   # slider: 100 ms per tick; clamp 24 h
+WARM_NEIGHBOURS = 50              # tracks per other playlist pre-parsed after startup
+WARM_BATCH = 64                   # tracks per warm-up MetaJob (one cache query each)
+ICON_CACHE_MAX, PIXMAP_CACHE_KB = 2048, 65_536   # row icons kept; QPixmapCache limit
+MISSING_TTL = 30.0                # s before cached "file missing" flags are re-checked
 
 def contrast_text_color(bg_hex: str) -> str:
     """Return black or white depending on background brightness."""
@@ -288,47 +333,464 @@ def contrast_text_color(bg_hex: str) -> str:
     brightness = 0.299 * r + 0.587 * g + 0.114 * b
     return "#000000" if brightness > 186 else "#ffffff"
 
-def strip_dpr(px: QPixmap) -> QPixmap:
-    dpr = px.devicePixelRatioF()
-    if dpr == 1.0: return px
-    cp = px.scaled(int(px.width()*dpr), int(px.height()*dpr),
-                   Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
-    cp.setDevicePixelRatio(1.0)
-    return cp
+@lru_cache(maxsize=4096)
+def _format_display(title:str,artist:str,name:str)->str:
+    disp = f"{artist} – {title}" if title and artist else (title or artist)
+    return disp or name
+
+_STYLESHEET_TEMPLATE = (
+    "QWidget {{font-family:Segoe UI; font-size:10pt;}}"
+    "QListView::item {{padding:2px 4px;}}"
+    "QListView::item:selected {{background:{hi}; color:{hi_text};}}"
+    "QPushButton {{padding:4px 12px; border:1px solid {midlight}; border-radius:4px; background:{button};}}"
+    "QPushButton:hover {{background:{hover};}}"
+)
+
+@lru_cache(maxsize=8)
+def _build_stylesheet(hi:int,hi_text:int,midlight:int,button:int)->str:
+    """QSS with literal colours (no palette() lookups left for Qt to resolve)."""
+    c=lambda rgb:QColor.fromRgb(rgb).name()
+    return _STYLESHEET_TEMPLATE.format(hi=c(hi),hi_text=c(hi_text),midlight=c(midlight),
+                                       button=c(button),hover=QColor.fromRgb(hi).lighter(150).name())
+
+def _hash_key(raw:bytes)->str:
+    """16-hex-char cache-file stem for *raw* (xxh3, else blake2b)."""
+    if xxhash: return xxhash.xxh3_64_hexdigest(raw)
+    return hashlib.blake2b(raw,digest_size=8).hexdigest()
+
+def _art_key(path:Path)->str:
+    return _hash_key(os.fsencode(path))
+
+# ---------- tag / art extraction (thread-safe: no Qt objects) ----------
+ART_STEMS, ART_EXTS = ("cover","folder","front","AlbumArt","Artwork"), (".jpg",".jpeg",".png")
+SIDECAR_MIN = 16_384          # bytes; a folder image this big wins outright
+
+def _img_size(data:bytes)->Tuple[int,int]:
+    """(w, h) from the PNG IHDR / JPEG SOFn / WebP VP8* header; PIL only for other formats."""
+    if data[:8]==b"\x89PNG\r\n\x1a\n" and len(data)>=24:
+        return int.from_bytes(data[16:20],"big"), int.from_bytes(data[20:24],"big")
+    if data[:2]==b"\xff\xd8":
+        i,n=2,len(data)
+        while i+9<n:
+            if data[i]!=0xFF: i+=1; continue
+            m=data[i+1]
+            if m in (0xD8,0x01) or 0xD0<=m<=0xD7 or m==0xFF: i+=1 if m==0xFF else 2; continue
+            if 0xC0<=m<=0xCF and m not in (0xC4,0xC8,0xCC):
+                return int.from_bytes(data[i+7:i+9],"big"), int.from_bytes(data[i+5:i+7],"big")
+            i+=2+int.from_bytes(data[i+2:i+4],"big")
+        return 0,0
+    if data[:4]==b"RIFF" and data[8:12]==b"WEBP" and len(data)>=30:
+        kind=data[12:16]
+        if kind==b"VP8X":
+            return 1+int.from_bytes(data[24:27],"little"), 1+int.from_bytes(data[27:30],"little")
+        if kind==b"VP8 ":
+            return int.from_bytes(data[26:28],"little")&0x3FFF, int.from_bytes(data[28:30],"little")&0x3FFF
+        if kind==b"VP8L":
+            b=int.from_bytes(data[21:25],"little")
+            return 1+(b&0x3FFF), 1+((b>>14)&0x3FFF)
+    try:                                            # unknown magic → PIL header read
+        with Image.open(io.BytesIO(data)) as im: return im.width, im.height
+    except Exception: return 0,0
+
+def _probe(data:bytes,mime:str,prio:int):
+    w,h=_img_size(data)
+    return (w*h,len(data),prio,data,mime)
+
+PROBE_HEAD = 65_536           # bytes of a folder image read to find its size
+
+def _probe_file(f:Path,mime:str):
+    """_probe() for a folder image from its header only; the candidate
+    carries the Path, and just the winner is read in full."""
+    with open(f,"rb") as fh: head=fh.read(PROBE_HEAD)
+    w,h=_img_size(head)
+    if not w and len(head)==PROBE_HEAD: w,h=_img_size(f.read_bytes())   # SOF past the head
+    return (w*h,f.stat().st_size,0,f,mime)
+
+def _sidecars(path:Path):
+    for stem in ART_STEMS:
+        for ext in ART_EXTS:
+            f=path.parent/f"{stem}{ext}"
+            if f.exists(): yield f
+
+def _big_sidecar(path:Path)->Optional[Path]:
+    return next((f for f in _sidecars(path) if f.stat().st_size>=SIDECAR_MIN),None)
+
+def _embedded_pics(audio):
+    """Yield (data, mime, type) per embedded picture, one at a time."""
+    if isinstance(audio.tags,ID3):
+        for ap in audio.tags.getall("APIC"): yield ap.data, ap.mime, ap.type
+    for pic in getattr(audio,"pictures",None) or ():
+        yield pic.data, pic.mime, getattr(pic,"type",3)
+    if isinstance(audio,MP4) and audio.tags:
+        for c in audio.tags.get("covr",()):
+            yield bytes(c), "image/png" if c.imageformat==MP4Cover.FORMAT_PNG else "image/jpeg", 3
+    if isinstance(audio,(OggVorbis,OggOpus)) and audio.tags:
+        for b64 in audio.tags.get("metadata_block_picture",()):
+            try: pic=Picture(base64.b64decode(b64))
+            except Exception: continue
+            yield pic.data, pic.mime, pic.type
+
+def _extract_art(audio,path:Path)->Optional[Path]:
+    return _store_art(path,_embedded_pics(audio))
+
+def _store_art(path:Path,pics)->Optional[Path]:
+    """Best of the embedded *pics* [(data, mime, type)] and folder images,
+    written once under ART_DIR."""
+    cand=chain((_probe(data, mime or "image/jpeg", 2 if ptype==3 else 1) for data,mime,ptype in pics),
+               (_probe_file(f,"image/png" if f.suffix.lower()==".png" else "image/jpeg") for f in _sidecars(path)))
+    best=max(cand,key=lambda t:(t[0],t[1],t[2]),default=None)   # running max: one picture held
+    if best is None: return None
+    *_,data,mime=best
+    if isinstance(data,Path): data=data.read_bytes()
+    ext=".png" if "png" in mime else ".jpg"
+    art=ART_DIR/(_hash_key(data)+ext)               # content key: one file per album, not per track
+    if not art.exists():                            # album tracks race on it: publish whole
+        tmp=art.with_name(f"{art.name}.{os.getpid()}.{threading.get_ident()}")
+        tmp.write_bytes(data); os.replace(tmp,art)
+    return art
+
+THUMB_PX = (48, 256)              # row icon, now-playing cover (logical px)
+THUMB_DPR = 1.0                   # screen device-pixel ratio; set by MainWindow
+THUMB_FMT, THUMB_EXT = ("WEBP", ".webp") if features.check("webp") else ("JPEG", ".jpg")
+
+def _thumb_path(art:Path,px:int)->Path:
+    # extracted art is already content-keyed; folder images key by path
+    key=art.stem if art.parent==ART_DIR else _art_key(art)
+    return ART_DIR/f"{key}_{px}{THUMB_EXT}"
+
+def _make_thumbs(art:Path)->None:
+    """Write pre-scaled WebP derivatives of *art* once (shared per album),
+    at physical size for the current THUMB_DPR."""
+    todo=[px for px in {round(px*THUMB_DPR) for px in THUMB_PX} if not _thumb_path(art,px).exists()]
+    if not todo: return
+    try:
+        with Image.open(art) as src:
+            # JPEG: let libjpeg's IDCT scale down while decoding (no-op for
+            # other formats); no copy() – that forces a full-size decode.
+            # reducing_gap=1: box-reduce to 1–2× the target, Lanczos only the rest
+            big=max(todo); src.draft("RGB",(big*2,big*2))
+            im=src.convert("RGB")
+        with im:                                    # source fd closed; pixels freed on exit
+            for px in sorted(todo,reverse=True):    # shrink in place, largest first
+                t=_thumb_path(art,px); tmp=t.with_name(f"{t.name}.{os.getpid()}.{threading.get_ident()}")
+                im.thumbnail((px,px),Image.LANCZOS,reducing_gap=1.0); im.save(tmp,THUMB_FMT,quality=75,method=4)
+                os.replace(tmp,t)                   # atomic: workers may race on a sidecar
+    except Exception as e:
+        print("thumbnail failed:", art, e)
+
+def _cached_art(path:Path)->Optional[Path]:
+    """Art extracted for *path* on an earlier run, if still on disk."""
+    a=storage.meta_art(path)
+    return Path(a) if a and Path(a).exists() else None
+
+# tags-only readers by extension (skip File()'s format sniffing); anything
+# else goes through MFile(easy=True)
+_EASY_OPEN = {".mp3": EasyMP3, ".flac": FLAC, ".m4a": EasyMP4, ".mp4": EasyMP4}
+# full (tags + pictures) readers by extension, one parse each; else MFile()
+_FULL_OPEN = {".mp3": MP3, ".flac": FLAC, ".m4a": MP4, ".mp4": MP4,
+              ".ogg": OggVorbis, ".opus": OggOpus}
+def _open_audio(p:Path,easy:bool):
+    """Parse *p* with the class its extension implies, else (unknown or wrong
+    guess – Opus/FLAC in .ogg, AAC named .mp3 …) let MFile sniff it."""
+    cls=(_EASY_OPEN if easy else _FULL_OPEN).get(p.suffix.lower())
+    if cls:
+        try: return cls(p)
+        except MutagenError: pass
+    return MFile(p, easy=easy)
+
+TITLE_KEYS, ARTIST_KEYS = ("TIT2","TITLE","title","\xa9nam"), ("TPE1","ARTIST","artist","\xa9ART")
+
+def _first_tag(tags,keys)->str:
+    for k in keys:
+        try: v=tags.get(k)
+        except Exception: v=None
+        if v: return str(v[0])
+    return ""
+
+def read_meta(p:Path)->Tuple[str,str,Optional[Path]]:
+    """(title, artist, cached-art-path) for *p*; never raises.
+
+    When art is already on disk (cache or a big sidecar) only the text tags
+    are read; embedded pictures are probed only when they can matter."""
+    title = artist = ""; art = None
+    try:
+        art = _cached_art(p) or _big_sidecar(p)
+        if (fast := tags.read_tags(p, want_picture=not art)) is not None:
+            title, artist, pic = fast               # header walk: picture bytes only if needed
+            return title, artist, art or _store_art(p, [pic] if pic else [])
+        audio = _open_audio(p, easy=bool(art))
+        if getattr(audio, "tags", None):
+            title, artist = _first_tag(audio.tags, TITLE_KEYS), _first_tag(audio.tags, ARTIST_KEYS)
+        if audio is not None and not art:
+            art = _extract_art(audio, p)
+    except Exception:
+        pass
+    return title, artist, art
+
+def scan_missing(paths)->Dict[Path,bool]:
+    """{path: missing?} with one scandir per parent folder instead of a stat per track."""
+    by_dir:Dict[Path,List[Path]]={}
+    for p in paths: by_dir.setdefault(p.parent,[]).append(p)
+    out={}
+    for d,ps in by_dir.items():
+        try:
+            with os.scandir(d) as it:
+                names={os.path.normcase(e.name) for e in it if not e.is_dir()}
+        except OSError:
+            names=set()
+        for p in ps: out[p]=os.path.normcase(p.name) not in names
+    return out
+
+def load_meta_many(paths)->List[Tuple[Path,Tuple[str,str,Optional[Path]],Optional[tuple]]]:
+    """read_meta() behind the on-disk cache for a batch of tracks (one cache
+    query for all) → [(path, meta, row-to-store | None)]."""
+    out, stats = [], []
+    for p in paths:
+        try: stats.append((p, p.stat()))
+        except OSError: out.append((p, ("","",None), None))
+    hits=storage.meta_get_many((p,st.st_mtime,st.st_size) for p,st in stats)
+    for p,st in stats:
+        hit=hits.get(str(p))
+        if hit and (not hit[2] or Path(hit[2]).exists()):
+            art=Path(hit[2]) if hit[2] else None
+            if art: _make_thumbs(art)
+            out.append((p, (hit[0],hit[1],art), None)); continue
+        title,artist,art=read_meta(p)               # miss → parse, tombstone if tag-less
+        if art: _make_thumbs(art)
+        out.append((p, (title,artist,art), (str(p),st.st_mtime,st.st_size,title,artist,str(art) if art else None)))
+    return out
 
 class TimelineSlider(QSlider):
-    """Clickable / draggable / wheel-seek slider (Ctrl = ±1 s, else ±5 s)."""
+    """Clickable / draggable / wheel-seek slider (Ctrl = ±1 s, else ±5 s).
+
+    Drag and wheel seeks are coalesced: only the latest target is emitted
+    once per SEEK_MS, so fast scrubbing doesn't queue dozens of VLC seeks.
+    """
     jumpRequested = Signal(float)          # seconds (float)
+    SEEK_MS = 33                           # ≈30 Hz while dragging
 
     def __init__(self,*a,**k):
         super().__init__(*a,**k); self.setOrientation(Qt.Horizontal)
+        self._pending_seek:Optional[int]=None
+        self._seek_timer=QTimer(self,singleShot=True,interval=self.SEEK_MS,timeout=self._flush_seek)
+        self._lo,self._span=self.minimum(),self.maximum()-self.minimum()
+        self.rangeChanged.connect(self._on_range)
+
+    # Qt 6 events expose position(); Qt 5-style ones only pos()
+    _POS = "position" if hasattr(QMouseEvent,"position") else "pos"
+
+    def _on_range(self,lo:int,hi:int):
+        self._lo,self._span=lo,hi-lo
 
-    def _val(self,x:int)->int:
-        r = max(0, min(x/self.width(), 1))
-        return int(self.minimum() + r*(self.maximum()-self.minimum()))
+    def _val(self,e)->int:
+        r = max(0, min(getattr(e,self._POS)().x()/self.width(), 1))
+        return int(self._lo + r*self._span)
+
+    @property
+    def seeking(self)->bool:
+        return self.isSliderDown() or self._pending_seek is not None
+
+    def _queue_seek(self,v:int):
+        self._pending_seek=v
+        if not self._seek_timer.isActive(): self._seek_timer.start()
+
+    def _flush_seek(self):
+        self._seek_timer.stop()
+        if self._pending_seek is not None:
+            v,self._pending_seek=self._pending_seek,None
+            self.jumpRequested.emit(v/TICKS)
 
     def mousePressEvent(self,e):
         if e.button()==Qt.LeftButton:
             self.setSliderDown(True)
-            v=self._val(int(e.position().x() if hasattr(e,"position") else e.pos().x()))
-            self.setValue(v); self.jumpRequested.emit(v/TICKS); e.accept()
+            v=self._val(e)
+            self.setValue(v); self._pending_seek=v; self._flush_seek(); e.accept()
         super().mousePressEvent(e)
 
     def mouseMoveEvent(self,e):
         if self.isSliderDown():
-            v=self._val(int(e.position().x() if hasattr(e,"position") else e.pos().x()))
-            self.setValue(v); self.jumpRequested.emit(v/TICKS); e.accept()
+            v=self._val(e)
+            self.setValue(v); self._queue_seek(v); e.accept()
         super().mouseMoveEvent(e)
 
     def mouseReleaseEvent(self,e):
-        if self.isSliderDown(): self.setSliderDown(False); e.accept()
+        if self.isSliderDown(): self.setSliderDown(False); self._flush_seek(); e.accept()
         super().mouseReleaseEvent(e)
 
     def wheelEvent(self,e):
         step = 1 if e.modifiers() & Qt.ControlModifier else 5
         delta = step * (e.angleDelta().y() // 120)
         self.setValue(max(self.minimum(), min(self.maximum(), self.value()+delta*TICKS)))
-        self.jumpRequested.emit(self.value()/TICKS); e.accept()
+        self._queue_seek(self.value()); e.accept()
+
+class TrackListModel(QAbstractListModel):
+    """Virtual track list: text / icon are produced only for painted rows.
+
+    *display*, *icon* and *missing* are the window's lazy lookups; rows are
+    grey when finished, red when the file is missing, bold when current.
+    One row may carry a resume/play position in PROGRESS_ROLE (0..1).
+    """
+    GRAY, RED = QColor("gray"), QColor("red")
+    PROGRESS_ROLE = Qt.UserRole + 1
+    PROGRESS_STEPS = 1024                 # repaint only when the bar can move
+
+    def __init__(self, display, icon, missing, *, mark_current: bool = False, parent=None):
+        super().__init__(parent)
+        self._display, self._icon, self._missing = display, icon, missing
+        self._mark     = mark_current         # "▶ " prefix on current row
+        self._tracks: List[Path] = []
+        self._finished: Set[str] = set()
+        self._cur      = -1
+        self._rows: Dict[Path, List[int]] = {}
+        self._bold     = QFont(); self._bold.setBold(True)
+        self._prog     = (-1, 0)              # (row, frac quantised to PROGRESS_STEPS)
+
+    def reset(self, tracks: List[Path], finished: Set[str], cur: int) -> None:
+        """Swap in a playlist with one modelReset; for the same list only the
+        rows whose current / finished state changed are repainted."""
+        if tracks is self._tracks and tracks:
+            changed = {self._cur, cur}
+            for f in finished ^ self._finished:
+                changed.update(self._rows.get(Path(f), ()))
+            self._finished, self._cur = finished, cur
+            for r in changed:
+                if 0 <= r < len(tracks):
+                    ix = self.index(r, 0)
+                    self.dataChanged.emit(ix, ix)
+            return
+        self.beginResetModel()
+        self._tracks, self._finished, self._cur = tracks, finished, cur
+        self._prog = (-1, 0)
+        self._rows = {}
+        for i, t in enumerate(tracks):
+            self._rows.setdefault(t, []).append(i)
+        self.endResetModel()
+
+    def path_changed(self, p: Path) -> None:
+        """Repaint rows showing *p* (metadata arrived)."""
+        for r in self._rows.get(p, ()):
+            ix = self.index(r, 0)
+            self.dataChanged.emit(ix, ix)
+
+    def set_progress(self, row: int, frac: float = 0.0) -> None:
+        """Show the position bar at *frac* on *row* (-1 hides it)."""
+        if not 0 <= row < len(self._tracks): row = -1
+        new = (row, int(max(0.0, min(frac, 1.0)) * self.PROGRESS_STEPS) if row >= 0 else 0)
+        if new == self._prog: return
+        old, self._prog = self._prog[0], new
+        for r in {old, row} - {-1}:
+            ix = self.index(r, 0)
+            self.dataChanged.emit(ix, ix, [self.PROGRESS_ROLE])
+
+    def paths(self, first: int, last: int) -> List[Path]:
+        """Tracks of rows *first*..*last* inclusive."""
+        return self._tracks[max(first, 0):last + 1]
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tracks)
+
+    # roles resolved once: data() runs per painted row × role, and every
+    # Qt.XxxRole is a lookup on the wrapped enum type
+    _DISPLAY, _DECOR, _FG, _FONT, _USER = (Qt.DisplayRole, Qt.DecorationRole,
+                                           Qt.ForegroundRole, Qt.FontRole, Qt.UserRole)
+
+    def data(self, index, role=Qt.DisplayRole):
+        r = index.row()
+        if not (0 <= r < len(self._tracks)):
+            return None
+        p = self._tracks[r]
+        if role == self._DISPLAY:
+            return ("▶ " if self._mark and r == self._cur else "") + self._display(p)
+        if role == self._DECOR:
+            return self._icon(p)
+        if role == self._FG:
+            if self._missing(p):          return self.RED
+            if str(p) in self._finished:  return self.GRAY
+            return None
+        if role == self._FONT:
+            return self._bold if r == self._cur else None
+        if role == self._USER:
+            return str(p)
+        if role == self.PROGRESS_ROLE:
+            return self._prog[1] / self.PROGRESS_STEPS if r == self._prog[0] else -1.0
+        return None
+
+class ProgressBarDelegate(QStyledItemDelegate):
+    """Paints the 2 px position marker inside the row that carries one."""
+    def __init__(self, color: str, parent=None):
+        super().__init__(parent)
+        self._color = QColor(color)
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        frac = index.data(TrackListModel.PROGRESS_ROLE)
+        if frac is not None and frac >= 0:
+            r = option.rect
+            x = min(r.x() + int(frac * r.width()), r.right() - 1)
+            painter.fillRect(x, r.y(), 2, r.height(), self._color)
+
+class _MetaSignals(QObject):
+    """Worker → GUI hand-off.  Metadata results pile up in *results*; one
+    queued ready() drains however many landed meanwhile."""
+    ready   = Signal()                                   # see take()
+    missing = Signal(object)                             # {path: missing?}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.results: deque = deque()                    # (path, (title, artist, art), db row)
+        self.queued = False
+
+    def post(self, res) -> None:                         # pool thread
+        self.results.extend(res)
+        if not self.queued:
+            self.queued = True; self.ready.emit()
+
+    def take(self) -> list:                              # GUI thread
+        self.queued = False                              # later posts signal again
+        out, q = [], self.results
+        while q: out.append(q.popleft())
+        return out
+
+class _PlayerSignals(QObject):
+    """Marshals libVLC time/end events onto the GUI thread, at most one
+    queued at a time."""
+    position = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.queued = False
+
+    def notify(self):                                    # libVLC event thread
+        if not self.queued:
+            self.queued = True; self.position.emit()
+
+class MetaJob(QRunnable):
+    """Pool job: parse tags + art for a batch of paths, deliver via one
+    queued signal.  Given a deque instead, it takes the newest path (the
+    rows painted last, i.e. on screen) when it gets to run."""
+    def __init__(self, paths, sig: _MetaSignals):
+        super().__init__()
+        self._paths, self._sig = paths, sig
+
+    def run(self):
+        paths = self._paths
+        if isinstance(paths, deque):
+            try: paths = [paths.pop()]
+            except IndexError: return               # pruned by a scroll
+        res = load_meta_many(paths)
+        try: self._sig.post(res)
+        except RuntimeError: pass                   # window already gone
+
+class MissingJob(QRunnable):
+    """Pool job: resolve existence for a batch of paths (scan_missing)."""
+    def __init__(self, paths: List[Path], sig: _MetaSignals):
+        super().__init__()
+        self._paths, self._sig = paths, sig
+
+    def run(self):
+        res = scan_missing(self._paths)
+        try: self._sig.missing.emit(res)
+        except RuntimeError: pass
 
 # ═════════════════ 3. CreatePlaylistDialog ═════════════════
 class CreatePlaylistDialog(QDialog):
@@ -348,7 +810,9 @@ class CreatePlaylistDialog(QDialog):
 
     def _add_files(self):
         files,_ = QFileDialog.getOpenFileNames(self,"Select audio files")
-        for f in sorted(files,key=str.lower): self.list.addItem(f)
+        self.list.setUpdatesEnabled(False)
+        self.list.addItems(sorted(files,key=str.lower))       # one insert, one layout pass
+        self.list.setUpdatesEnabled(True)
 
     def _remove_sel(self):
         for it in self.list.selectedItems(): self.list.takeItem(self.list.row(it))
@@ -356,12 +820,12 @@ class CreatePlaylistDialog(QDialog):
     def _move_sel(self,delta:int):
         rows = sorted({self.list.row(it) for it in self.list.selectedItems()})
         if not rows: return
-        dest = [r+delta for r in rows]
-        if min(dest)<0 or max(dest)>=self.list.count(): return
-        items = [self.list.takeItem(r) for r in reversed(rows)]
-        for r,it in zip(dest, reversed(items)):
-            self.list.insertItem(r,it)
-            self.list.setItemSelected(it,True)
+        if rows[0]+delta<0 or rows[-1]+delta>=self.list.count(): return
+        runs = [[r for _,r in g] for _,g in groupby(enumerate(rows), lambda p:p[1]-p[0])]
+        model = self.list.model()
+        for run in (runs if delta<0 else reversed(runs)):  # leading run first: others keep their rows
+            r,n = run[0],len(run)
+            model.moveRows(QModelIndex(), r, n, QModelIndex(), r+delta if delta<0 else r+n+delta)
 
     def tracks(self)->List[str]:
         return [self.list.item(i).text() for i in range(self.list.count())]
@@ -384,20 +848,44 @@ class MainWindow(QWidget):
 
         # runtime state
         self._playlists:List[scanner.Playlist]=[]
+        self._known_paths:Set[Path]=set()            # mirrors _playlists for O(1) dedupe
         self._cur_pl_idx:Optional[int]=None
         self._meta_cache:Dict[Path,Tuple[str,str,Optional[Path]]]={}
-        self._icon_cache:Dict[Path,QPixmap]={}
-        self._pending_meta:set[Path]=set()          # paths scheduled for lazy load
+        self._icon_cache:"OrderedDict[Path,QIcon]"=OrderedDict()   # LRU by art file (content-keyed)
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_KB)     # scaled art, shared per file
+        self._display_cache:Dict[Path,str]={}
+        self._hint_titles:Dict[Path,str]={}         # from playlists' #EXTINF lines
+        self._finished_sets:Dict[Path,Set[str]]={}    # per playlist, shared with the models
+        self._lengths:Dict[Path,float]={}             # resume-bar fallback, parsed once per track
+        self._pending_meta:set[Path]=set()          # paths in batch jobs on _meta_pool
+        self._warm_meta:set[Path]=set()             # paths in low-priority warm-up jobs
+        self._want_sel:deque[Path]=deque()          # on-demand requests per view, served newest first
+        self._want_cur:deque[Path]=deque()
+        self._in_want:Dict[Path,deque]={}           # requested path → its view's deque, until loaded
+        self._cover_want:deque[Path]=deque(maxlen=1)  # only the latest now-playing track
+        self._meta_pool=QThreadPool(self); self._meta_pool.setMaxThreadCount(min(8,os.cpu_count() or 1))
+        self._meta_sig=_MetaSignals(self); self._meta_sig.ready.connect(self._on_meta_ready)
+        self._meta_sig.missing.connect(self._on_missing)
+        self._missing_cache:Dict[Path,bool]={}; self._missing_at=time.monotonic()
+        self._missing_todo:set[Path]=set()           # batched into one MissingJob
+        blank=QPixmap(48,48); blank.fill(Qt.transparent); self._blank48=QIcon(blank)
+        global THUMB_DPR; THUMB_DPR=self._dpr()      # before any MetaJob runs
+        self._meta_dirty:Dict[str,tuple]={}          # rows awaiting storage.meta_put
+        self._meta_flush=QTimer(self,singleShot=True,interval=500,timeout=self._flush_meta)
+        self._state_timer=QTimer(self,singleShot=True,interval=250,timeout=self._flush_state)
+        self._named:Dict[Path,str]={}                # display names already in history
+        self._last_secs=(-1,-1)                     # (pos, length) shown in lbl_time
         self._auto_resume=False
         self._normalize=False
         self._compress=False
         self._theme="System"
         # ---- build player, defer heavy work until window is visible ---
-        self._player = player.VLCGaplessPlayer(self._on_track_change)
+        self._player_sig=_PlayerSignals(self); self._player_sig.position.connect(self._on_position)
+        self._player = player.VLCGaplessPlayer(self._on_track_change, on_finished=self._on_track_finished,
+                                               on_position=self._player_sig.notify)
 
         self._wire_signals()                      # widgets respond now
         QTimer.singleShot(50, self._finish_startup)  # heavy work later
-        QTimer(self,interval=100,timeout=self._tick).start()
         # ── Global Play/Pause hot-keys: register *every* alias ──────────────
         self._hotkey_ids: list[int] = []
         if keyboard:
@@ -470,17 +958,39 @@ class MainWindow(QWidget):
             self.slider.setEnabled(True)
             self._player.play()
             self._on_track_change()
+        QTimer.singleShot(0, self._warm_cache)
+
+    def _warm_cache(self):
+        """Queue tag parsing for the selected playlist (all) and the head of
+        every other one at low priority; visible rows still jump the queue."""
+        sel=self._sel_pl()
+        self._warm([p for pl in ([sel] if sel else [])+[pl for pl in self._playlists if pl is not sel]
+                      for p in (pl.tracks if pl is sel else pl.tracks[:WARM_NEIGHBOURS])])
+
+    def _warm(self,paths):
+        """Low-priority MetaJobs for the uncached, unqueued *paths*; tracked
+        apart from _pending_meta so on-screen requests still jump the queue."""
+        todo=[]
+        for p in paths:
+            if p not in self._meta_cache and p not in self._pending_meta \
+                    and p not in self._warm_meta and p not in self._in_want:
+                self._warm_meta.add(p); todo.append(p)
+        for i in range(0,len(todo),WARM_BATCH):
+            self._meta_pool.start(MetaJob(todo[i:i+WARM_BATCH],self._meta_sig),-1)
 
     # ---------- UI
     def _build_widgets(self):
         self.list_playlists = QListWidget(frameShape=QFrame.NoFrame)
-
-        self.tracks_sel = QListWidget(frameShape=QFrame.NoFrame); self.tracks_sel.setSelectionMode(QListWidget.NoSelection)
+        self.list_playlists.setUniformItemSizes(True)   # one-line names: no per-item size hints on bulk add
+
+        self._sel_model = TrackListModel(lambda p: self._display(p, self._want_sel),
+                                         lambda p: self._icon48(p, self._want_sel), self._is_missing, parent=self)
+        self._cur_model = TrackListModel(lambda p: self._display(p, self._want_cur),
+                                         lambda p: self._icon48(p, self._want_cur), self._is_missing,
+                                         mark_current=True, parent=self)
+        self.tracks_sel = self._track_view(self._sel_model, "#00a29f")
         self.lbl_curtitle = QLabel("Now Playing",alignment=Qt.AlignCenter); self.lbl_curtitle.setStyleSheet("font-weight:bold;")
-        self.tracks_cur = QListWidget(frameShape=QFrame.NoFrame); self.tracks_cur.setSelectionMode(QListWidget.NoSelection)
-
-        self._bar_sel  = QFrame(self.tracks_sel.viewport());  self._bar_sel.setStyleSheet("background:#00a29f;"); self._bar_sel.setFixedWidth(2); self._bar_sel.hide()
-        self._bar_play = QFrame(self.tracks_cur.viewport());  self._bar_play.setStyleSheet("background:#00c8ff;"); self._bar_play.setFixedWidth(2); self._bar_play.hide()
+        self.tracks_cur = self._track_view(self._cur_model, "#00c8ff")
 
         self.cmb_output = QComboBox(); self.cmb_output.addItems(AUDIO_OPTIONS)
         self.chk_normalize = QCheckBox("Normalize volume")
@@ -517,17 +1027,20 @@ class MainWindow(QWidget):
 
         root = QVBoxLayout(self); root.addLayout(tb); root.addWidget(split,1); root.addLayout(pb)
 
+    @staticmethod
+    def _track_view(model:TrackListModel,bar:str)->QListView:
+        v = QListView(frameShape=QFrame.NoFrame); v.setSelectionMode(QListView.NoSelection)
+        v.setUniformItemSizes(True); v.setLayoutMode(QListView.Batched)
+        v.setModel(model); v.setItemDelegate(ProgressBarDelegate(bar, v))
+        return v
+
     # ---------- style
     def _init_style(self):
-        hi=self.palette().color(QPalette.Highlight)
-        self._row_bg=hi.lighter(130).name(); hover=hi.lighter(150).name()
-        self.setStyleSheet(
-            "QWidget {font-family:Segoe UI; font-size:10pt;}"
-            "QListWidget::item {padding:2px 4px;}"
-            "QListWidget::item:selected {background:palette(Highlight); color:palette(HighlightedText);}"
-            "QPushButton {padding:4px 12px; border:1px solid palette(Midlight); border-radius:4px; background:palette(Button);}"+
-            f"QPushButton:hover {{background:{hover};}}"
-        )
+        pal=QApplication.palette(); hi=pal.color(QPalette.Highlight)   # app palette: set synchronously by _apply_theme
+        self._row_bg=hi.lighter(130).name()
+        css=_build_stylesheet(hi.rgb(),*(pal.color(r).rgb() for r in
+                              (QPalette.HighlightedText,QPalette.Midlight,QPalette.Button)))
+        if css!=self.styleSheet(): self.setStyleSheet(css)   # same CSS → no re-polish
 
     def _apply_theme(self,name:str):
         app=QApplication.instance()
@@ -569,7 +1082,10 @@ class MainWindow(QWidget):
 
     # ---------- signals
     def _wire_signals(self):
+        for v, want in ((self.tracks_sel, self._want_sel), (self.tracks_cur, self._want_cur)):
+            v.verticalScrollBar().valueChanged.connect(partial(self._prune_meta, v, want))
         self.slider.jumpRequested.connect(self._player.seek)
+        self.slider.jumpRequested.connect(lambda _: self._player_sig.notify())   # paused seeks too
         self.cmb_output.currentIndexChanged.connect(lambda i:self._player.set_output(AUDIO_MODES[i]))
         self.btn_create.clicked.connect(self._create_playlist)
         self.btn_scan.clicked.connect(self._scan_folder)
@@ -609,113 +1125,159 @@ class MainWindow(QWidget):
             if p.is_dir():
                 changed |= self._add_playlists(scanner.scan_playlists(p))
             elif p.suffix.lower() in scanner.PLAYLIST_EXTS:
-                pl=next((pl for pl in scanner.scan_playlists(p.parent,False) if pl.path==p),None)
-                if pl: changed |= self._add_playlists([pl])
+                if pl:=scanner.load_playlist(p): changed |= self._add_playlists([pl])
         if changed: self._save_state()
 
     # ═════════════════ 6. metadata & icons ═════════════════
-    def _probe(self,data:bytes,mime:str,prio:int):
-        area=0
-        try:
-            with Image.open(io.BytesIO(data)) as im: area=im.width*im.height
-        except Exception: pass
-        return (area,len(data),prio,data,mime)
-
-    def _extract_art(self,audio,path:Path):
-        cand=[]
-        if isinstance(audio.tags,ID3):
-            for ap in audio.tags.getall("APIC"):
-                cand.append(self._probe(ap.data, ap.mime or "image/jpeg", 2 if ap.type==3 else 1))
-        if getattr(audio,"pictures",None):
-            for pic in audio.pictures:
-                cand.append(self._probe(pic.data, pic.mime or "image/jpeg", 2 if getattr(pic,"type",3)==3 else 1))
-        for stem in ("cover","folder","front","AlbumArt","Artwork"):
-            for ext in (".jpg",".jpeg",".png"):
-                f=path.parent/f"{stem}{ext}"
-                if f.exists():
-                    cand.append(self._probe(f.read_bytes(),"image/png" if ext.endswith("png") else "image/jpeg",0))
-        if not cand: return None
-        cand.sort(key=lambda t:(t[0],t[1],t[2]),reverse=True)
-        *_,data,mime=cand[0]
-        ext=".png" if "png" in mime else ".jpg"
-        art=ART_DIR/(hashlib.md5(str(path).encode()).hexdigest()+ext)
-        if not art.exists(): art.write_bytes(data)
-        return art
-
-    def _meta(self, p: Path):
-        if p in self._meta_cache:
-            title, artist, art = self._meta_cache[p]
-            if art is None:
-                try:
-                    audio = MFile(p)
-                    art = self._extract_art(audio, p)
-                except Exception:
-                    art = None
-                self._meta_cache[p] = (title, artist, art)
-            return self._meta_cache[p]
-
-        title = artist = ""; art = None
-        try:
-            audio = MFile(p)
-            if getattr(audio, "tags", None):
-                title  = (audio.tags.get("TIT2") or audio.tags.get("TITLE")  or [""])[0]
-                artist = (audio.tags.get("TPE1") or audio.tags.get("ARTIST") or [""])[0]
-            art = self._extract_art(audio, p)
-        except Exception:
-            pass
-        self._meta_cache[p] = (title, artist, art)
-        return self._meta_cache[p]
-
-    # ---------- fast placeholder; real tags load lazily ----------
-    def _display(self, p: Path) -> str:
+    def _queue_meta_row(self, row) -> None:
+        if not row: return
+        self._meta_dirty[row[0]] = row
+        if not self._meta_flush.isActive(): self._meta_flush.start()
+
+    def _flush_meta(self) -> None:
+        rows, self._meta_dirty = list(self._meta_dirty.values()), {}
+        if rows: storage.meta_put(rows)
+
+    def _request_meta(self, p: Path, want: Optional[deque]) -> None:
+        """Queue *p* on the asking view's *want* deque (None: don't ask)."""
+        if want is None or p in self._pending_meta or p in self._in_want: return
+        want.append(p); self._in_want[p] = want
+        self._meta_pool.start(MetaJob(want, self._meta_sig))
+
+    @staticmethod
+    def _on_screen(view: QListView) -> Set[Path]:
+        vp = view.viewport().rect()
+        top = view.indexAt(vp.topLeft()).row()
+        if top < 0: return set()
+        bot = view.indexAt(vp.bottomLeft()).row()
+        if bot < 0: bot = view.model().rowCount() - 1
+        return set(view.model().paths(top, bot))
+
+    def _prune_meta(self, view: QListView, want: deque, *_) -> None:
+        """*view* scrolled: drop its queued requests for rows that left the
+        viewport; rows still on screen keep theirs (Qt blits them, no data()).
+        A dropped path the other pane still shows moves to that pane's queue."""
+        keep = self._on_screen(view)
+        if not keep: return                         # mid-relayout (Batched) or empty: leave it
+        stale = [p for p in want if p not in keep]
+        if not stale: return
+        for p in stale:
+            try: want.remove(p)
+            except ValueError: continue             # a worker took it meanwhile
+            del self._in_want[p]
+        other, o_want = ((self.tracks_cur, self._want_cur) if view is self.tracks_sel
+                         else (self.tracks_sel, self._want_sel))
+        shown = self._on_screen(other)
+        for p in stale:
+            if p in shown: self._request_meta(p, o_want)
+
+    # ---------- fast placeholder; real tags load on the pool ----------
+    def _display(self, p: Path, want: Optional[deque] = None) -> str:
+        disp = self._display_cache.get(p)
+        if disp is not None: return disp
         if p in self._meta_cache:
             t, a, _ = self._meta_cache[p]
-            disp = f"{a} – {t}" if t and a else (t or a)
-            return disp or p.name
-
-        # schedule metadata fetch once
-        if p not in self._pending_meta:
-            self._pending_meta.add(p)
-            QTimer.singleShot(0, lambda path=p: self._fetch_meta(Path(path)))
-
-        return p.name
-
-    def _icon48(self,p:Path):
-        if p in self._icon_cache: return QIcon(self._icon_cache[p])
-        _,_,art=self._meta(p)
-        if art and art.exists():
-            pix=strip_dpr(QPixmap(str(art))).scaled(48,48,Qt.KeepAspectRatio,Qt.SmoothTransformation)
-            self._icon_cache[p]=pix; return QIcon(pix)
-        return None
-
-    def _fetch_meta(self, p: Path) -> None:
-        """Background-load tags for one track and refresh visible rows."""
-        self._pending_meta.discard(p)
-
-        title = artist = ""
-        try:
-            audio = MFile(p)
-            if audio and audio.tags:
-                title  = (audio.tags.get("TIT2") or audio.tags.get("TITLE")  or [""])[0]
-                artist = (audio.tags.get("TPE1") or audio.tags.get("ARTIST") or [""])[0]
-        except Exception:
-            pass
-
-        # store minimal entry; art is extracted on demand
-        self._meta_cache[p] = (title, artist, None)
-        new_txt = f"{artist} – {title}" if artist and title else (title or artist or p.name)
-
-        # update text in both list widgets
-        for lw in (self.tracks_sel, self.tracks_cur):
-            for i in range(lw.count()):
-                it = lw.item(i)
-                if it and Path(it.data(Qt.UserRole) or "") == p:
-                    it.setText(new_txt)
-
-    def _cover(self,p:Path):
-        _,_,art=self._meta(p)
-        return (strip_dpr(QPixmap(str(art))).scaled(self.ART_PX,self.ART_PX,Qt.KeepAspectRatio,Qt.SmoothTransformation)
-                if art and art.exists() else None)
+            disp = self._display_cache[p] = _format_display(t, a, p.name)
+            return disp
+        self._request_meta(p, want)
+        return self._hint_titles.get(p, p.name)     # #EXTINF text until tags arrive
+
+    def _icon48(self,p:Path,want:Optional[deque]=None)->QIcon:
+        meta=self._meta_cache.get(p)
+        if meta is None:
+            self._request_meta(p,want); return self._blank48
+        art=meta[2]
+        if not art: return self._blank48
+        ico=self._icon_cache.get(art)                  # one QIcon per album art, shared by its rows
+        if ico is not None: self._icon_cache.move_to_end(art); return ico
+        pix=self._scaled_art(art,48,fast=True)
+        ico=self._icon_cache[art]=QIcon(pix) if pix else self._blank48
+        if len(self._icon_cache)>ICON_CACHE_MAX: self._icon_cache.popitem(last=False)
+        return ico
+
+    # ---------- file existence, resolved on the pool ----------
+    def _is_missing(self, p: Path) -> bool:
+        m = self._missing_cache.get(p)
+        if m is None:
+            if not self._missing_todo: QTimer.singleShot(0, self._resolve_missing)
+            self._missing_todo.add(p)
+            return False                                # not red until known
+        return m
+
+    def _resolve_missing(self) -> None:
+        todo, self._missing_todo = list(self._missing_todo), set()
+        if todo: self._meta_pool.start(MissingJob(todo, self._meta_sig))
+
+    def _on_missing(self, res: Dict[Path, bool]) -> None:
+        self._missing_cache.update(res)
+        for p, gone in res.items():
+            if gone:
+                for model in (self._sel_model, self._cur_model): model.path_changed(p)
+
+    def _forget_missing(self, max_age: float = 0.0) -> None:
+        if time.monotonic() - self._missing_at >= max_age:
+            self._missing_cache.clear(); self._missing_at = time.monotonic()
+
+    def _on_meta_ready(self) -> None:
+        """Pool results (GUI thread): cache them and repaint affected rows."""
+        for p, meta, row in self._meta_sig.take():
+            self._pending_meta.discard(p); self._warm_meta.discard(p)
+            if (want := self._in_want.pop(p, None)) is not None:
+                try: want.remove(p)                 # loaded by another job first
+                except ValueError: pass
+            self._meta_cache[p] = meta
+            self._queue_meta_row(row)
+            self._display_cache.pop(p, None)
+            for model in (self._sel_model, self._cur_model):
+                model.path_changed(p)
+            if self._player.playlist and p == self._player.playlist[self._player.idx]:
+                self._show_cover()
+
+    def _dpr(self)->float:
+        return self.devicePixelRatioF()
+
+    def _scaled_art(self,art:Path,px:int,*,fast:bool=False)->Optional[QPixmap]:
+        """*px* logical pixels of *art* at the screen's DPR: the worker's
+        pre-scaled thumbnail if present, else scaled here (*fast*: from the
+        cover thumb without filtering – fine at icon size)."""
+        dpr=self._dpr(); phys=round(px*dpr)
+        key=f"{phys}:{art}"
+        if (pix:=QPixmapCache.find(key)) is not None: return pix
+        t=_thumb_path(art,phys)
+        if t.exists(): pix=QPixmap(str(t))
+        elif fast and (big:=_thumb_path(art,round(self.ART_PX*dpr))).exists():
+            pix=QPixmap(str(big)).scaled(phys,phys,Qt.KeepAspectRatio,Qt.FastTransformation)
+        elif art.exists():
+            rd=QImageReader(str(art)); rd.setAutoTransform(True)
+            if (sz:=rd.size()).isValid():           # decoder downsamples (JPEG: during IDCT)
+                rd.setScaledSize(sz.scaled(phys,phys,Qt.KeepAspectRatio))
+            pix=QPixmap.fromImage(rd.read())
+            if pix.isNull(): return None
+        else: return None
+        # small art is never upscaled on disk: let Qt stretch it to *px* logical
+        pix.setDevicePixelRatio(min(dpr,max(pix.width(),pix.height())/px) or dpr)
+        QPixmapCache.insert(key,pix)
+        return pix
+
+    def _prefetch_covers(self, n: int = 2):
+        """Parse the next *n* tracks now, so their covers (and thumbs) are
+        ready when playback gets there."""
+        pl,i=self._player.playlist,self._player.idx
+        todo=[p for p in pl[i+1:i+1+n] if p not in self._meta_cache and p not in self._pending_meta]
+        if todo:
+            self._pending_meta.update(todo)
+            self._meta_pool.start(MetaJob(todo,self._meta_sig))
+
+    def _show_cover(self):
+        """Now-playing cover; if its tags aren't in yet, ask the pool ahead
+        of everything else and let _on_meta_ready call back."""
+        p=self._player.playlist[self._player.idx]
+        if p not in self._meta_cache:
+            self._cover_want.append(p)                 # replaces a not-yet-started skip
+            self._meta_pool.start(MetaJob(self._cover_want,self._meta_sig),1)
+            self.lbl_cover.setPixmap(QPixmap()); return
+        _,_,art=self._meta_cache[p]
+        self.lbl_cover.setPixmap((self._scaled_art(art,self.ART_PX) if art else None) or QPixmap())
 
     # ═════════════════ 7. persistence ═════════════════
     def _load_state(self):
@@ -741,21 +1303,29 @@ class MainWindow(QWidget):
             self.chk_compress.setChecked(self._compress)
         last    = state.get("last")
         records = state.get("playlists", [])
-        for rec in records:
-            p = Path(rec["path"])
-            if not p.exists():
-                continue
-            pl = next((pl for pl in scanner.scan_playlists(p.parent, False) if pl.path == p), None)
+        # read the playlist files concurrently (I/O bound); map() keeps order,
+        # missing / unreadable files come back as None
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+            parsed = list(ex.map(lambda rec: scanner.load_playlist(Path(rec["path"])), records))
+        loaded = []
+        for rec, pl in zip(records, parsed):
             if pl:
+                p = pl.path
                 hist_name = history.load(p).get("display_name", p.stem)
                 pl.name = rec.get("name", hist_name)
-                self._playlists.append(pl)
-                self.list_playlists.addItem(pl.name)
+                self._playlists.append(pl); self._known_paths.add(pl.path)
+                self._hint_titles.update(pl.titles); loaded.append(pl.name)
+        self.list_playlists.addItems(loaded)
         if last:
             self._cur_pl_idx = next((i for i, pl in enumerate(self._playlists) if str(pl.path) == last), None)
             self._highlight_row()
 
     def _save_state(self):
+        """Coalesce toggles / slider drags into one state write."""
+        self._state_timer.start()
+
+    def _flush_state(self):
+        self._state_timer.stop()
         last = str(self._player._pl_path) if self._player._pl_path else (
             str(self._playlists[self._cur_pl_idx].path) if self._cur_pl_idx is not None else None)
         self._auto_resume = self.chk_resume.isChecked()
@@ -770,21 +1340,32 @@ class MainWindow(QWidget):
             "theme": self._theme,
             "boost_gain": self.sld_boost.value(),
         }
-        storage.save(state)
+        storage.save_async(state)                      # JSON + fsync off the UI thread
         for pl in self._playlists:
-            history.ensure_name(pl.path, pl.name)
+            if self._named.get(pl.path) != pl.name:    # only renamed / new playlists
+                history.ensure_name(pl.path, pl.name); self._named[pl.path] = pl.name
 
     # ═════════════════ 8. playlist management ═════════════════
     def _add_playlists(self,new:List[scanner.Playlist])->bool:
-        added=False
+        names=[]; heads=[]
         for pl in new:
-            if all(pl.path!=o.path for o in self._playlists):
-                self._playlists.append(pl); self.list_playlists.addItem(pl.name); added=True
-        return added
+            if pl.path not in self._known_paths:
+                self._known_paths.add(pl.path)
+                self._playlists.append(pl); names.append(pl.name)
+                self._hint_titles.update(pl.titles)
+                heads+=pl.tracks[:WARM_NEIGHBOURS]
+        if names:
+            self.list_playlists.setUpdatesEnabled(False)
+            self.list_playlists.addItems(names)
+            self.list_playlists.setUpdatesEnabled(True)
+            self._warm(heads)                       # first rows ready before they're opened
+        return bool(names)
 
     def _scan_folder(self):
         folder=QFileDialog.getExistingDirectory(self,"Choose folder")
-        if folder and self._add_playlists(scanner.scan_playlists(Path(folder))): self._save_state()
+        if not folder: return
+        self._forget_missing()
+        if self._add_playlists(scanner.scan_playlists(Path(folder))): self._save_state()
 
     def _sel_pl(self)->Optional[scanner.Playlist]:
         idx=self.list_playlists.currentRow()
@@ -804,7 +1385,7 @@ class MainWindow(QWidget):
         if QMessageBox.question(self,"Delete playlist",f"Remove “{pl.name}” from list?\n(File stays on disk.)",
                                  QMessageBox.Yes|QMessageBox.No)==QMessageBox.Yes:
             i=self.list_playlists.currentRow()
-            self.list_playlists.takeItem(i); self._playlists.pop(i)
+            self.list_playlists.takeItem(i); self._known_paths.discard(self._playlists.pop(i).path)
             self._save_state(); self._refresh_sel()
 
     def _create_playlist(self):
@@ -817,66 +1398,67 @@ class MainWindow(QWidget):
                                             "M3U8 playlist (*.m3u8)")
         if not fname: return
         path=Path(fname)
-        try: path.write_text("\n".join(tracks),encoding="utf-8")
+        titles={t:self._display(Path(t)) for t in tracks if Path(t) in self._meta_cache}   # parsed → #EXTINF
+        try:
+            scanner.write_m3u8(path,tracks,titles)
         except Exception as e:
             QMessageBox.critical(self,"Error",f"Could not write playlist:\n{e}"); return
-        pl=scanner.Playlist(path=path,name=path.stem,tracks=[Path(t) for t in tracks])
+        pl=scanner.Playlist(path=path,name=path.stem,tracks=[Path(t) for t in tracks],
+                            titles={Path(t):d for t,d in titles.items()})
         if self._add_playlists([pl]): history.ensure_name(pl.path,pl.name); self._save_state()
 
     # ═════════════════ 9. list helpers ═════════════════
-    def _make_item(self, p: Path, prefix: str = ""):
-        it = QListWidgetItem(prefix + self._display(p))
-        it.setData(Qt.UserRole, str(p))                 # store path for updates
-        if (ico := self._icon48(p)):
-            it.setIcon(ico)
-        return it
-
-    def _place_bar(self,bar:QFrame,lw:QListWidget,idx:int,frac:float):
-        if not(0<=idx<lw.count()): bar.hide(); return
-        rect=lw.visualItemRect(lw.item(idx)); width=lw.viewport().width()
-        x=int(max(0,min(rect.left()+frac*rect.width(),width-2)))
-        bar.setGeometry(x,rect.top(),2,rect.height()); bar.show()
+    # (position bars are painted by ProgressBarDelegate from the models)
 
     # ═════════════════ 10. refresh panes ═════════════════
     def _refresh_sel(self):
-        self.tracks_sel.clear(); self._bar_sel.hide()
+        self._forget_missing(MISSING_TTL)
         pl=self._sel_pl()
-        if not pl: return
+        if not pl: self._sel_model.reset([],set(),-1); return
         hist=history.load(pl.path)
-        finished=set(hist.get("finished",[]))
+        finished=self._finished_of(pl.path,hist)
         idx=hist.get("track_index",-1)
         pos=float(hist.get("position",0)); length=float(hist.get("length",0))
         if (length<=0 or length is None) and 0<=idx<len(pl.tracks):
-            try:length=MFile(pl.tracks[idx]).info.length or 0
-            except Exception:length=0
+            length=self._track_length(pl.tracks[idx])
         frac=pos/max(1,length)
-        for i,t in enumerate(pl.tracks):
-            it=self._make_item(Path(t))
-            if str(t) in finished: it.setForeground(QColor("gray"))
-            if not Path(t).exists(): it.setForeground(QColor("red"))
-            if i==idx: f=it.font(); f.setBold(True); it.setFont(f)
-            self.tracks_sel.addItem(it)
-        if pos>0 and 0<=idx<len(pl.tracks): self._place_bar(self._bar_sel,self.tracks_sel,idx,frac)
+        self._sel_model.reset(pl.tracks,finished,idx)
+        self._sel_model.set_progress(idx if pos>0 else -1,frac)
 
     def _refresh_cur(self):
-        self.tracks_cur.clear(); self._bar_play.hide()
-        if not self._player.playlist: return
-        fin=set(history.load(self._player._pl_path).get("finished",[]))
-        for i,t in enumerate(self._player.playlist):
-            it=self._make_item(Path(t),"▶ " if i==self._player.idx else "")
-            if i==self._player.idx:
-                f=it.font(); f.setBold(True); it.setFont(f)
-            if str(t) in fin: it.setForeground(QColor("gray"))
-            if not Path(t).exists(): it.setForeground(QColor("red"))
-            self.tracks_cur.addItem(it)
+        if not self._player.playlist: self._cur_model.reset([],set(),-1); return
+        fin=self._finished_of(self._player._pl_path)
+        self._cur_model.reset(self._player.playlist,fin,self._player.idx)
         self._place_play_bar()
 
-    def _place_play_bar(self):
-        if not self._player.player: self._bar_play.hide(); return
-        length=max(1,self._player.length()); frac=self._player.position()/length
-        self._place_bar(self._bar_play,self.tracks_cur,self._player.idx,frac)
-
-    def _highlight_row(self) -> None:
+    def _track_length(self,p:Path)->float:
+        if (n:=self._lengths.get(p)) is None:
+            try:n=MFile(p).info.length or 0
+            except Exception:n=0
+            self._lengths[p]=n
+        return n
+
+    def _finished_of(self,pl_path:Path,hist:Optional[Dict]=None)->Set[str]:
+        """Finished-track set for *pl_path*, read from history once and then
+        kept current by _on_track_finished."""
+        fs=self._finished_sets.get(pl_path)
+        if fs is None:
+            if hist is None: hist=history.load(pl_path)
+            fs=self._finished_sets[pl_path]=set(hist.get("finished",[]))
+        return fs
+
+    def _on_track_finished(self,track:str):
+        fs=self._finished_sets.get(self._player._pl_path)
+        if fs is None: return
+        fs.add(track)
+        for model in (self._sel_model,self._cur_model): model.path_changed(Path(track))
+
+    def _place_play_bar(self,frac:Optional[float]=None):
+        if not self._player.player: self._cur_model.set_progress(-1); return
+        if frac is None: frac=self._player.position()/max(1,self._player.length())
+        self._cur_model.set_progress(self._player.idx,frac)
+
+    def _highlight_row(self, refresh: bool = True) -> None:
         # select the stored row, or clear if index is invalid
         if self._cur_pl_idx is not None and 0 <= self._cur_pl_idx < self.list_playlists.count():
             self.list_playlists.setCurrentRow(self._cur_pl_idx)
@@ -891,7 +1473,7 @@ class MainWindow(QWidget):
             f = it.font(); f.setBold(bold); it.setFont(f)
 
         # keep the middle pane in sync with the highlighted playlist
-        self._refresh_sel()
+        if refresh: self._refresh_sel()
 
     # ═════════════════ 11. playback helper ═════════════════
     def _play_selected(self):
@@ -931,26 +1513,41 @@ class MainWindow(QWidget):
     def _update_time_label(self,pos:float,length:float):
         self.lbl_time.setText(f"{int(pos)//60:02}:{int(pos)%60:02} / {int(length)//60:02}:{int(length)%60:02}")
 
-    # ═════════════════ 12. timer tick ═════════════════
-    def _tick(self):
+    # ═════════════════ 12. position updates (VLC events) ═════════════════
+    def _on_position(self):
+        self._player_sig.queued=False
         self._player.tick()
-        if self._player.player:
-            length=max(1,min(MAX_SECONDS,self._player.length()))
-            pos=max(0,min(self._player.position(),length))
-            if not self.slider.isSliderDown():
-                self.slider.setMaximum(int(length*TICKS)); self.slider.setValue(int(pos*TICKS))
-            self._update_time_label(pos,length); self._place_play_bar()
+        if self._player.player and not self.isMinimized():   # nothing to paint while iconified
+            length,pos=self._player.length_and_position()
+            length=max(1,min(MAX_SECONDS,length)); pos=max(0,min(pos,length))
+            slider=self.slider
+            if not slider.seeking:                     # write only visible changes
+                mx,val=int(length*TICKS),int(pos*TICKS)
+                if mx!=slider.maximum(): slider.setMaximum(mx)
+                if abs(val-slider.value())*slider.width()>=mx:   # ≥1 px of groove
+                    slider.setValue(val)
+            secs=(int(pos),int(length))
+            if secs!=self._last_secs: self._last_secs=secs; self._update_time_label(pos,length)
+            self._place_play_bar(pos/length)
             sel_pl=self._sel_pl()
             if sel_pl and sel_pl.path==self._player._pl_path:
-                self._place_bar(self._bar_sel,self.tracks_sel,self._player.idx,pos/length)
+                self._sel_model.set_progress(self._player.idx,pos/length)
+
+    def changeEvent(self,e):
+        super().changeEvent(e)
+        if e.type()==QEvent.WindowStateChange and hasattr(self,"_player") and not self.isMinimized():
+            self._on_position()                         # catch up after being minimized
 
     # ═════════════════ 13. VLC callback ═════════════════
     def _on_track_change(self,*_):
         self.slider.setEnabled(True)
         self._cur_pl_idx=next((i for i,pl in enumerate(self._playlists) if pl.path==self._player._pl_path),None)
         cur=self._sel_pl(); self.lbl_curtitle.setText(cur.name if cur else "Now Playing")
-        self._highlight_row(); self._refresh_cur(); self._refresh_sel()
-        self.lbl_cover.setPixmap(self._cover(self._player.playlist[self._player.idx]) or QPixmap())
+        self._highlight_row(refresh=False); self._refresh_cur()
+        sel=self._sel_pl()                              # other playlists are unchanged
+        if sel and sel.path==self._player._pl_path: self._refresh_sel()
+        self._show_cover(); self._prefetch_covers()
+        self._on_position()
 
     # ═════════════════ 14. close ═════════════════
     def closeEvent(self,e):
@@ -960,7 +1557,8 @@ class MainWindow(QWidget):
                     keyboard.remove_hotkey(hid)
                 except Exception:
                     pass
-        self._player.close(); self._save_state(); super().closeEvent(e)
+        self._meta_pool.clear(); self._meta_pool.waitForDone(2000); self._flush_meta()
+        self._player.close(); self._flush_state(); super().closeEvent(e)
 
 # ═════════════════ 15. entry-point ═════════════════
 if __name__ == "__main__":
@@ -9,9 +9,9 @@ Gap-less VLC wrapper with debounced—but *guaranteed*—history writes.
 """
 
 from __future__ import annotations
-import time, threading
+import time, threading, bisect
 from pathlib import Path
-from typing  import List, Set, Callable, Dict
+from typing  import List, Callable, Dict
 
 import vlc
 # Does this libVLC support --compressor-softclip?
@@ -63,14 +63,22 @@ class VLCGaplessPlayer:
             print("boost-gain restart failed:", e)
             self._boost_gain_db = old_gain      # roll back on failure
     def __init__(self, on_track_change: Callable[[], None], *,
-                 write_interval: float = WRITE_INTERVAL):
-        """Create player with optional history write interval."""
+                 write_interval: float = WRITE_INTERVAL,
+                 on_finished: Callable[[str], None] | None = None,
+                 on_position: Callable[[], None] | None = None):
+        """Create player with optional history write interval.
+
+        *on_finished(path)* fires when a track is newly marked finished.
+        *on_position()* fires on libVLC's event thread whenever playback time
+        moves or a track ends – hand it to the GUI thread, then call tick()."""
         self.WRITE_INTERVAL = float(write_interval)
         self._aout_mode  = "default"
         self._normalize  = False
         self._compress   = False
         self._boost_gain_db = 12     # make-up gain used when compressor active
         self._cb         = on_track_change
+        self._on_finished = on_finished
+        self._on_position = on_position
         self._instance   = None
         self._make_instance()
 
@@ -79,7 +87,7 @@ class VLCGaplessPlayer:
         self.playlist: List[Path] = []
         self.idx       = 0
         self._pl_path: Path | None = None
-        self._finished: Set[str]   = set()
+        self._finished: List[str]  = []     # kept sorted (bisect)
         self.player: vlc.MediaPlayer | None = None
 
         # history-writer state
@@ -196,23 +204,28 @@ class VLCGaplessPlayer:
         hist     = history.load(pl_path)
         self.idx = min(hist.get("track_index", 0), max(0, len(tracks)-1))
         position = float(hist.get("position", 0))
-        self._finished = set(hist.get("finished", []))
+        self._finished = sorted(set(hist.get("finished", [])))
 
         self._set_media(self.playlist[self.idx], resume=position)
         self._cb()
 
     # ─────────────────────────────── media helpers
-    def _attach_end_event(self):
-        self.player.event_manager().event_attach(
-            vlc.EventType.MediaPlayerEndReached,
-            lambda *_: setattr(self, "_next_pending", True)
-        )
+    def _attach_events(self):
+        em = self.player.event_manager()
+        em.event_attach(vlc.EventType.MediaPlayerEndReached, self._on_end)
+        if self._on_position:         # paused/stopped players send none → idle UI
+            em.event_attach(vlc.EventType.MediaPlayerTimeChanged,
+                            lambda *_: self._on_position())
+
+    def _on_end(self, *_):
+        self._next_pending = True     # next_track() must not run on VLC's thread
+        if self._on_position: self._on_position()
 
     def _set_media(self, path: Path, *, resume: float = 0.0):
         if self.player: self.player.stop()
         self.player = self._instance.media_player_new()
         self.player.set_media(self._instance.media_new(str(path)))
-        self._attach_end_event()
+        self._attach_events()
         self.player.play()
         if resume:
             for _ in range(10):
@@ -246,15 +259,24 @@ class VLCGaplessPlayer:
     # ─────────────────────────────── position helpers
     def length(self)   -> float: return (self.player.get_length() or 0)/1000 if self.player else 0.0
     def position(self) -> float: return (self.player.get_time()   or 0)/1000 if self.player else 0.0
+    def length_and_position(self) -> tuple[float, float]:
+        """(length, position) in seconds from one player lookup."""
+        mp = self.player
+        if not mp: return 0.0, 0.0
+        return (mp.get_length() or 0)/1000, (mp.get_time() or 0)/1000
     def seek(self, s: float):
         if self.player:
             self.player.set_time(int(s*1000))
             self._mark_dirty(force=True)
-            self.flush_history()   # persist on large position jump
+            self.flush_history(throttle=True)   # coalesce drag/wheel seeks
 
     def _mark_finished(self):
         if self._pl_path and self.playlist:
-            self._finished.add(str(self.playlist[self.idx]))
+            p = str(self.playlist[self.idx])
+            i = bisect.bisect_left(self._finished, p)
+            if i == len(self._finished) or self._finished[i] != p:
+                self._finished.insert(i, p)
+                if self._on_finished: self._on_finished(p)
 
     # ─────────────────────────────── history (writer thread)
     def _snapshot(self) -> Dict:
@@ -262,7 +284,7 @@ class VLCGaplessPlayer:
             "pl_path":     self._pl_path,
             "track_index": self.idx,
             "position":    self.position(),
-            "finished":    set(self._finished),
+            "finished":    list(self._finished),
         }
 
     def _mark_dirty(self, *, force: bool=False):
@@ -293,22 +315,26 @@ class VLCGaplessPlayer:
                     snap["finished"],
                 )
 
-    def flush_history(self):
+    def flush_history(self, *, throttle: bool = False):
+        """Write current state now (*throttle*: defer position-only moves)."""
         with self._lock:
             snap = self._snapshot() if self._pl_path else None
             self._pending = None
         if snap:
-            history.save(snap["pl_path"],
-                         snap["track_index"],
-                         snap["position"],
-                         snap["finished"])
+            save = history.save_throttled if throttle else history.save
+            save(snap["pl_path"],
+                 snap["track_index"],
+                 snap["position"],
+                 snap["finished"])
 
     def close(self):
         self._closed = True
         self.flush_history()
+        history.flush_pending()
+        history.flush(2.0)            # let queued history writes land
         self._writer_th.join(0.6)     # wait ≤ 600 ms
 
-    # ─────────────────────────────── GUI tick (every 0.1 s)
+    # ─────────────────────────────── GUI tick (per on_position, else polled)
     def tick(self):
         if self._next_pending:
             self._next_pending = False
@@ -317,7 +343,7 @@ class VLCGaplessPlayer:
             cur = self.position()
             if abs(cur - self._last_tick_pos) > 2.0:
                 self._mark_dirty(force=True)
-                self.flush_history()
+                self.flush_history(throttle=True)
             else:
                 self._mark_dirty()   # update _pending (may flush later)
             self._last_tick_pos = cur
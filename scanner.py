@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-# scanner.py – rev-s8  (2025-06-28)
+# scanner.py – rev-s9  (2026-10-15)
 """
 Playlist discovery & parsing.
 
@@ -11,21 +11,25 @@ Playlist discovery & parsing.
 Public API
 ──────────
 scan_playlists(root: Path, recursive=True) → list[Playlist]
+load_playlist(path: Path)                   → Playlist | None
+write_m3u8(path: Path, tracks, titles=None)  → None
 """
 
 from __future__ import annotations
-import re, urllib.parse
+import os, re, urllib.parse
 from pathlib import Path
-from typing  import List, Dict, Iterable
+from typing  import List, Dict, Iterable, Iterator, Optional
 
 PLAYLIST_EXTS = {".m3u", ".m3u8", ".fplite"}
 
 # ───── simple data class ───────────────────────────────────────────
 class Playlist:
-    def __init__(self, *, path: Path, name: str, tracks: List[Path]):
+    def __init__(self, *, path: Path, name: str, tracks: List[Path],
+                 titles: Optional[Dict[Path, str]] = None):
         self.path   = path
         self.name   = name
         self.tracks = tracks
+        self.titles = titles or {}      # #EXTINF display text, where present
     def __repr__(self): return f"<Playlist {self.name!r} ({len(self.tracks)} tracks)>"
 
 # ───── Foobar2000 index.txt cache ─────────────────────────────────
@@ -101,12 +105,17 @@ def _normalise(line: str) -> Path | None:
     return Path(line)
 
 # ───── playlist readers ───────────────────────────────────────────
-def _read_m3u(p: Path) -> list[str]:
-    tracks: list[str] = []
+def _read_m3u(p: Path, titles: Optional[Dict[Path, str]] = None) -> List[Path]:
+    tracks: List[Path] = []
+    info = None
     with p.open("r", encoding="utf-8", errors="replace") as f:
         for ln in f:
-            if q := _normalise(ln):
+            if ln.startswith("#EXTINF:"):           # "#EXTINF:<secs>,<display>"
+                info = ln.partition(",")[2].strip() or None
+            elif q := _normalise(ln):
                 tracks.append(q)
+                if info and titles is not None: titles[q] = info
+                info = None
     return tracks
 
 def _read_fplite(p: Path) -> List[Path]:
@@ -117,33 +126,57 @@ def _read_fplite(p: Path) -> List[Path]:
     text = text.replace("\x00", "\n")
     return [q for ln in text.splitlines() if (q := _normalise(ln))]
 
-def _read_playlist(p: Path) -> List[Path]:
+def _read_playlist(p: Path, titles: Optional[Dict[Path, str]] = None) -> List[Path]:
     ext = p.suffix.lower()
-    if ext in {".m3u", ".m3u8"}: return _read_m3u(p)
+    if ext in {".m3u", ".m3u8"}: return _read_m3u(p, titles)
     if ext == ".fplite":         return _read_fplite(p)
     return []
 
 # ───── scan public API ────────────────────────────────────────────
+def _walk(root: Path, recursive: bool) -> Iterator[Path]:
+    """Playlist files under *root*; DirEntry type info saves a stat per file."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    if e.is_file():
+                        if os.path.splitext(e.name)[1].lower() in PLAYLIST_EXTS:
+                            yield Path(e.path)
+                    elif recursive and e.is_dir(follow_symlinks=False):   # like rglob: no link cycles
+                        stack.append(Path(e.path))
+        except OSError:
+            continue
+
+def load_playlist(p: Path) -> Optional[Playlist]:
+    """Parse one playlist file; None if unreadable or empty."""
+    titles: Dict[Path, str] = {}
+    try: tracks = _read_playlist(p, titles)
+    except Exception: return None
+    if not tracks: return None
+
+    name = p.stem
+    if p.suffix.lower() == ".fplite":
+        idx = _load_index(p.parent)
+        name = idx.get(_norm_guid(p.stem), name)
+    return Playlist(path=p, name=name, tracks=tracks, titles=titles)
+
+def write_m3u8(path: Path, tracks: Iterable[str],
+               titles: Optional[Dict[str, str]] = None) -> None:
+    """Write an extended M3U8 in one go; *titles* add #EXTINF lines
+    (duration -1 = unknown) that load_playlist() hands back."""
+    titles = titles or {}
+    out = ["#EXTM3U"]
+    for t in tracks:
+        if disp := titles.get(t):               # one line: CR/LF would start a "track"
+            out.append("#EXTINF:-1," + " ".join(disp.splitlines()))
+        out.append(t)
+    path.write_bytes(("\n".join(out) + "\n").encode("utf-8"))
+
 def scan_playlists(root: Path, recursive: bool = True) -> List[Playlist]:
     """Return list of Playlist objects under *root* (file or folder)."""
-    if root.is_file() and root.suffix.lower() in PLAYLIST_EXTS:
+    if root.suffix.lower() in PLAYLIST_EXTS and root.is_file():
         walker: Iterable[Path] = [root]
-    elif recursive:
-        walker = (p for p in root.rglob("*") if p.suffix.lower() in PLAYLIST_EXTS)
     else:
-        walker = (p for p in root.iterdir()  if p.suffix.lower() in PLAYLIST_EXTS)
-
-    playlists: List[Playlist] = []
-    for p in walker:
-        tracks = []
-        try: tracks = _read_playlist(p)
-        except Exception: continue
-        if not tracks:  continue
-
-        name = p.stem
-        if p.suffix.lower() == ".fplite":
-            idx = _load_index(p.parent)
-            name = idx.get(_norm_guid(p.stem), name)
-
-        playlists.append(Playlist(path=p, name=name, tracks=tracks))
-    return playlists
+        walker = _walk(root, recursive)
+    return [pl for p in walker if (pl := load_playlist(p))]
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-# storage.py – rev-s6 (2025-07-01)
+# storage.py – rev-s7 (2026-10-15)
 
 r"""
 Resilient persistent-state helper
@@ -7,13 +7,16 @@ Resilient persistent-state helper
 * Same config folder for script **and** PyInstaller binary
   – Windows  : %APPDATA%\Playlist-Player\appstate.json
   – macOS/*nix: ~/.config/playlist-player/appstate.json
+* save_async() hands the state to a writer thread (latest state wins);
+  flush() waits for it – load() and interpreter exit flush first
+* meta.sqlite3 next to it caches per-track tags (see meta_get / meta_art / meta_put)
 ...
 """
 
 from __future__ import annotations
-import json, os, tempfile, shutil, datetime as _dt
+import atexit, json, os, shutil, sqlite3, threading
 from pathlib import Path
-from typing  import Any, Dict
+from typing  import Any, Dict, Iterable, Optional, Tuple
 
 # ────────────────────────────────────────────────────────────
 # 1. resolve canonical config path
@@ -30,6 +33,7 @@ else:
 CFG_DIR.mkdir(parents=True, exist_ok=True)
 STATE_FILE = CFG_DIR / "appstate.json"
 BAK_FILE   = CFG_DIR / "appstate.bak"
+META_DB    = CFG_DIR / "meta.sqlite3"
 
 # ────────────────────────────────────────────────────────────
 # 2. atomic writer (+ backup)
@@ -73,6 +77,7 @@ def _load_json(path: Path) -> Dict | None:
 # ────────────────────────────────────────────────────────────
 def load() -> Dict:
     """Return persisted state.  Rolls back to .bak on corruption."""
+    flush()                                  # a queued save_async() wins
     data = _load_json(STATE_FILE)
     if data is None:
         # try backup
@@ -98,3 +103,116 @@ def save(state: Dict) -> None:
     # add / update version tag for future migrations
     state["version"] = 1
     _atomic_write(STATE_FILE, state)
+
+
+def save_async(state: Dict) -> None:
+    """Queue *state* for the writer thread; returns immediately."""
+    global _WSTATE, _WTHREAD
+    state["version"] = 1
+    with _WCOND:
+        _WSTATE = state                      # supersedes any unwritten state
+        if _WTHREAD is None:
+            _WTHREAD = threading.Thread(target=_writer_loop, name="storage-writer", daemon=True)
+            _WTHREAD.start()
+        _WCOND.notify_all()
+
+
+def flush(timeout: Optional[float] = None) -> bool:
+    """Block until queued state is on disk; False on timeout."""
+    with _WCOND:
+        return _WCOND.wait_for(lambda: _WSTATE is None and not _WBUSY, timeout)
+
+
+# ────────────────────────────────────────────────────────────
+# 4b. background writer
+# ────────────────────────────────────────────────────────────
+_WCOND  = threading.Condition()
+_WSTATE: Optional[Dict] = None           # newest pending state, older ones dropped
+_WBUSY  = False
+_WTHREAD: Optional[threading.Thread] = None
+
+def _writer_loop() -> None:
+    global _WSTATE, _WBUSY
+    while True:
+        with _WCOND:
+            _WCOND.wait_for(lambda: _WSTATE is not None)
+            state, _WSTATE, _WBUSY = _WSTATE, None, True
+        try:
+            _atomic_write(STATE_FILE, state)
+        except Exception as e:
+            print("state save failed:", e)
+        with _WCOND:
+            _WBUSY = False
+            _WCOND.notify_all()
+
+atexit.register(flush)
+
+
+# ────────────────────────────────────────────────────────────
+# 5. track-metadata cache  (path, mtime, size) → title/artist/art
+# ────────────────────────────────────────────────────────────
+_META_LOCK = threading.Lock()            # one connection, shared by workers
+_META_CONN: Optional[sqlite3.Connection] = None
+
+def meta_db() -> sqlite3.Connection:
+    """Open (once) the WAL-mode metadata cache."""
+    global _META_CONN
+    with _META_LOCK:
+        if _META_CONN is None:
+            conn = sqlite3.connect(str(META_DB), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta("
+                         "path TEXT PRIMARY KEY, mtime REAL, size INTEGER,"
+                         " title TEXT, artist TEXT, art TEXT)")
+            conn.commit()
+            _META_CONN = conn
+        return _META_CONN
+
+
+def meta_get(path: Path, mtime: float, size: int) -> Optional[Tuple[str, str, Optional[str]]]:
+    """Cached (title, artist, art) if *path* is unchanged, else None.
+
+    Rows with empty tags are tombstones: the file was parsed and had none.
+    """
+    return meta_get_many([(path, mtime, size)]).get(str(path))
+
+
+def meta_get_many(entries: Iterable[Tuple[Path, float, int]]) -> Dict[str, Tuple[str, str, Optional[str]]]:
+    """meta_get() for a batch of (path, mtime, size): {str(path): row} for hits."""
+    want = {str(p): (m, s) for p, m, s in entries}
+    keys, out = list(want), {}
+    try:
+        conn = meta_db()
+        with _META_LOCK:
+            for i in range(0, len(keys), 500):       # stay under SQLite's variable limit
+                chunk = keys[i:i+500]
+                out.update((r[0], r[1:]) for r in conn.execute(
+                    "SELECT path, mtime, size, title, artist, art FROM meta WHERE path IN"
+                    f" ({','.join('?' * len(chunk))})", chunk))
+    except sqlite3.Error as e:
+        print("meta cache read failed:", e)
+        return {}
+    return {k: r[2:] for k, r in out.items() if (r[0], r[1]) == want[k]}
+
+
+def meta_art(path: Path) -> Optional[str]:
+    """Last art file recorded for *path*, whatever its mtime (None if unknown)."""
+    try:
+        conn = meta_db()
+        with _META_LOCK:
+            r = conn.execute("SELECT art FROM meta WHERE path=?", (str(path),)).fetchone()
+    except sqlite3.Error as e:
+        print("meta cache read failed:", e)
+        return None
+    return r[0] if r else None
+
+
+def meta_put(rows: Iterable[Tuple[str, float, int, str, str, Optional[str]]]) -> None:
+    """Insert / replace (path, mtime, size, title, artist, art) rows in one transaction."""
+    try:
+        conn = meta_db()
+        with _META_LOCK, conn:
+            conn.executemany("INSERT OR REPLACE INTO meta VALUES (?,?,?,?,?,?)", rows)
+    except sqlite3.Error as e:
+        print("meta cache write failed:", e)
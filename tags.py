@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# tags.py – rev-t1  (2026-10-15)
+"""
+Lazy tag reader for MP3 (ID3v2.3 / 2.4) and FLAC.
+
+• Walks frame / block headers and seeks over picture payloads, so the
+  text tags cost a few hundred bytes instead of the whole tag (embedded
+  covers are often several MB); without want_picture the walk stops once
+  title and artist are in hand
+• Only the largest picture is read, and only when asked for
+• Anything unusual (ID3v2.2, unsynchronised / compressed frames, no
+  title or artist at all …) returns None – the caller falls back to mutagen
+
+Public API
+──────────
+read_tags(path: Path, want_picture=False) → (title, artist, picture | None) | None
+    picture = (data: bytes, mime: str, picture_type: int)
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing  import BinaryIO, List, Optional, Tuple
+
+Picture = Tuple[bytes, str, int]
+Result  = Tuple[str, str, Optional[Picture]]
+
+# ───── ID3v2 ──────────────────────────────────────────────────────
+_ID3_ENC = {0: "latin-1", 1: "utf-16", 2: "utf-16-be", 3: "utf-8"}
+
+def _syncsafe(b: bytes) -> int:
+    return (b[0] << 21) | (b[1] << 14) | (b[2] << 7) | b[3]
+
+def _id3_text(b: bytes) -> str:
+    codec = _ID3_ENC.get(b[0]) if b else None
+    if codec is None: return ""
+    return next((v for v in b[1:].decode(codec, "replace").split("\x00") if v), "")
+
+def _apic(b: bytes) -> Picture:
+    """APIC body → (data, mime, type); skips the encoded description."""
+    enc, m = b[0], b.index(b"\x00", 1)
+    mime, ptype, i = b[1:m].decode("latin-1"), b[m+1], m + 2
+    if enc in (1, 2):                               # UTF-16: aligned double NUL
+        j = i
+        while True:
+            j = b.find(b"\x00\x00", j)
+            if j < 0: raise ValueError("unterminated APIC description")
+            if (j - i) % 2 == 0: break
+            j += 1
+        i = j + 2
+    else:
+        i = b.index(b"\x00", i) + 1
+    return b[i:], mime or "image/jpeg", ptype
+
+def _read_id3(f: BinaryIO, want_pic: bool) -> Optional[Result]:
+    hdr = f.read(10)
+    if len(hdr) < 10 or hdr[:3] != b"ID3" or hdr[3] not in (3, 4) or hdr[5] & 0x80:
+        return None                                 # no v2.3/2.4 tag, or whole-tag unsync
+    ver, end, pos = hdr[3], 10 + _syncsafe(hdr[6:10]), 10
+    if hdr[5] & 0x40:                               # extended header
+        ext = f.read(4)
+        pos += 4 + int.from_bytes(ext, "big") if ver == 3 else _syncsafe(ext)
+    bad_flags = 0xE0 if ver == 3 else 0x4F          # compression / encryption / unsync …
+    title = artist = ""
+    pics: List[Tuple[int, int]] = []                # (size, offset) – payloads stay on disk
+    while pos + 10 <= end:
+        f.seek(pos); fh = f.read(10)
+        if len(fh) < 10 or fh[0] == 0: break        # padding
+        fid = fh[:4]
+        size = _syncsafe(fh[4:8]) if ver == 4 else int.from_bytes(fh[4:8], "big")
+        if size <= 0 or pos + 10 + size > end: break
+        if fid in (b"TIT2", b"TPE1", b"APIC"):
+            if fh[9] & bad_flags: return None
+            if fid == b"APIC":  pics.append((size, pos + 10))
+            elif fid == b"TIT2": title  = title  or _id3_text(f.read(size))
+            else:                artist = artist or _id3_text(f.read(size))
+            if title and artist and not want_pic: break   # rest of the tag is of no use
+        pos += 10 + size
+    if not (title or artist): return None           # maybe ID3v1-only: let mutagen merge it
+    pic = None
+    if want_pic and pics:
+        size, at = max(pics); f.seek(at)
+        pic = _apic(f.read(size))
+    return title, artist, pic
+
+# ───── FLAC ───────────────────────────────────────────────────────
+def _u32(b: bytes, i: int) -> int:
+    return int.from_bytes(b[i:i+4], "big")
+
+def _vorbis(b: bytes) -> Tuple[str, str]:
+    found = {}
+    i = 4 + int.from_bytes(b[:4], "little")         # skip vendor string
+    n, i = int.from_bytes(b[i:i+4], "little"), i + 4
+    for _ in range(n):
+        ln = int.from_bytes(b[i:i+4], "little")
+        if i + 4 + ln > len(b): raise ValueError("corrupt Vorbis comment")   # bogus count / length
+        k, _, v = b[i+4:i+4+ln].decode("utf-8", "replace").partition("=")
+        found.setdefault(k.upper(), v); i += 4 + ln
+    return found.get("TITLE", ""), found.get("ARTIST", "")
+
+def _flac_picture(b: bytes) -> Picture:
+    ptype, ml = _u32(b, 0), _u32(b, 4)
+    mime = b[8:8+ml].decode("latin-1")
+    i = 8 + ml; i += 4 + _u32(b, i) + 16           # description, w/h/depth/colours
+    return b[i+4:i+4+_u32(b, i)], mime or "image/jpeg", ptype
+
+def _read_flac(f: BinaryIO, want_pic: bool) -> Optional[Result]:
+    if f.read(4) != b"fLaC": return None
+    title = artist = ""
+    pics: List[Tuple[int, int]] = []
+    while len(h := f.read(4)) == 4:
+        kind, size, at = h[0] & 0x7F, int.from_bytes(h[1:4], "big"), f.tell()
+        if kind == 4:   title, artist = _vorbis(f.read(size))
+        elif kind == 6: pics.append((size, at))
+        if h[0] & 0x80: break                       # last metadata block
+        if kind == 4 and not want_pic: break        # comments read; pictures not wanted
+        f.seek(at + size)
+    if not (title or artist): return None
+    pic = None
+    if want_pic and pics:
+        size, at = max(pics); f.seek(at)
+        pic = _flac_picture(f.read(size))
+    return title, artist, pic
+
+# ───── public API ─────────────────────────────────────────────────
+_READERS = {".mp3": _read_id3, ".flac": _read_flac}
+
+def read_tags(path: Path, want_picture: bool = False) -> Optional[Result]:
+    """(title, artist, picture | None) read lazily, or None → use mutagen."""
+    reader = _READERS.get(path.suffix.lower())
+    if reader is None: return None
+    try:
+        with open(path, "rb") as f:
+            return reader(f, want_picture)
+    except (OSError, ValueError, IndexError):
+        return None
@@ -0,0 +1,157 @@
+import importlib, os, tempfile, threading
+from pathlib import Path
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+history = importlib.import_module('history')
+
+class HistoryTests(TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.pl = Path(self._tmp.name) / 'mix.m3u8'
+        history._CACHE.clear()
+        history._FLUSHED.clear()
+        history._LAST_HASH.clear()
+        for fd in history._POS_FDS.values():
+            os.close(fd)
+        history._POS_FDS.clear()
+
+    def tearDown(self):
+        history.flush_pending()
+        history.flush()
+        self._tmp.cleanup()
+
+    def _save(self, *args):
+        history.save(self.pl, *args)
+        history.flush()
+
+    def test_round_trip_keeps_display_name(self):
+        history.ensure_name(self.pl, 'Road Trip')
+        self._save(3, 17.5, {'/b.flac', '/a.flac'})
+        data = history.load(self.pl)
+        self.assertEqual(data['display_name'], 'Road Trip')
+        self.assertEqual(data['track_index'], 3)
+        self.assertEqual(data['position'], 17.5)
+        self.assertEqual(data['finished'], ['/a.flac', '/b.flac'])
+
+    def test_missing_file_loads_empty(self):
+        self.assertEqual(history.load(self.pl), {})
+
+    def test_load_uses_cache_until_mtime_changes(self):
+        self._save(1, 0.0, set())
+        with patch.object(history, '_loads', wraps=history._loads) as parse:
+            history.load(self.pl)
+            parse.assert_not_called()
+            hp = history._paths(self.pl)[0]
+            st = hp.stat()
+            hp.write_bytes(history._dumps({'track_index': 7}))
+            os.utime(hp, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            self.assertEqual(history.load(self.pl)['track_index'], 7)
+            parse.assert_called_once()
+
+    def test_load_returns_copy(self):
+        self._save(1, 0.0, set())
+        history.load(self.pl)['track_index'] = 99
+        self.assertEqual(history.load(self.pl)['track_index'], 1)
+
+    def test_throttled_position_only_is_deferred(self):
+        self._save(1, 0.0, {'/a.flac'})
+        history.save_throttled(self.pl, 1, 42.0, {'/a.flac'}, min_interval=60)
+        self.assertEqual(history.load(self.pl)['position'], 0.0)
+        history.flush_pending()
+        self.assertEqual(history.load(self.pl)['position'], 42.0)
+
+    def test_throttled_structural_change_writes_now(self):
+        self._save(1, 0.0, set())
+        history.save_throttled(self.pl, 2, 5.0, set(), min_interval=60)
+        self.assertEqual(history.load(self.pl)['track_index'], 2)
+
+    def test_save_does_not_reread_file(self):
+        history.ensure_name(self.pl, 'Mix')
+        with patch.object(history, '_loads') as parse:
+            self._save(2, 1.0, [])
+            self._save(3, 2.0, [])
+            parse.assert_not_called()
+        self.assertEqual(history.load(self.pl)['display_name'], 'Mix')
+
+    def test_unchanged_payload_is_not_rewritten(self):
+        self._save(1, 3.0, [])
+        hp = history._paths(self.pl)[0]
+        ino = hp.stat().st_ino
+        history._atomic_write(self.pl, history._current(self.pl))
+        history.flush()
+        self.assertEqual(hp.stat().st_ino, ino)
+        self._save(2, 3.0, [])
+        self.assertNotEqual(hp.stat().st_ino, ino)
+
+    def test_only_structural_changes_fsync(self):
+        self._save(1, 3.0, [])
+        with patch.object(history.os, 'fsync') as fsync:
+            self._save(1, 4.0, [])
+            fsync.assert_not_called()
+            self._save(2, 0.0, [])
+            fsync.assert_called()
+
+    def test_backup_keeps_previous_contents(self):
+        self._save(1, 0.0, [])
+        self._save(2, 0.0, [])
+        bak = history._paths(self.pl)[1]
+        self.assertEqual(history._loads(bak.read_bytes())['track_index'], 1)
+
+    def test_corrupt_file_recovers_from_backup(self):
+        self._save(1, 0.0, [])
+        self._save(2, 0.0, [])
+        hp = history._paths(self.pl)[0]
+        st = hp.stat()
+        hp.write_bytes(b'{"track_index": 2, "pos')
+        os.utime(hp, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        self.assertEqual(history.load(self.pl)['track_index'], 1)
+
+    def test_non_mapping_payload_recovers_from_backup(self):
+        self._save(1, 0.0, [])
+        self._save(2, 0.0, [])
+        hp = history._paths(self.pl)[0]
+        st = hp.stat()
+        hp.write_bytes(history._dumps([1, 2]))
+        os.utime(hp, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        self.assertEqual(history.load(self.pl)['track_index'], 1)
+
+    @skipUnless(history.msgpack, 'msgpack not installed')
+    def test_legacy_json_is_migrated(self):
+        legacy = self.pl.with_suffix(self.pl.suffix + history.JSON_SUFFIX)
+        legacy.write_text('{"track_index": 4, "display_name": "Old"}',
+                          encoding='utf-8')
+        self.assertEqual(history.load(self.pl)['track_index'], 4)
+        history.flush()
+        self.assertTrue(history._paths(self.pl)[0].exists())
+        history._CACHE.clear()
+        self.assertEqual(history.load(self.pl)['display_name'], 'Old')
+
+    def test_finished_shares_folder_prefix_on_disk(self):
+        fin = ['/music/album/01.flac', '/music/album/02.flac']
+        self._save(0, 0.0, fin)
+        raw = history._paths(self.pl)[0].read_bytes()
+        self.assertEqual(raw.count(b'/music/album/'), 1)
+        history._CACHE.clear()
+        self.assertEqual(history.load(self.pl)['finished'], fin)
+
+    def test_save_is_visible_before_write_lands(self):
+        gate = threading.Event()
+        real = history._write_bytes
+        with patch.object(history, '_write_bytes',
+                          side_effect=lambda *a: (gate.wait(5), real(*a))):
+            history.save(self.pl, 5, 1.0, [])
+            self.assertFalse(history._paths(self.pl)[0].exists())
+            self.assertEqual(history.load(self.pl)['track_index'], 5)
+            gate.set()
+            history.flush()
+        self.assertTrue(history._paths(self.pl)[0].exists())
+
+    def test_position_only_save_uses_sidecar(self):
+        self._save(1, 3.0, ['/a.flac'])
+        hp = history._paths(self.pl)[0]
+        ino = hp.stat().st_ino
+        self._save(1, 95.25, ['/a.flac'])
+        self.assertEqual(hp.stat().st_ino, ino)
+        history._CACHE.clear()
+        self.assertEqual(history.load(self.pl)['position'], 95.25)
@@ -0,0 +1,60 @@
+import importlib, os, tempfile
+from pathlib import Path
+from unittest import TestCase, skipUnless
+
+scanner = importlib.import_module('scanner')
+
+class ScanTests(TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        (self.root / 'sub').mkdir()
+        (self.root / 'a.m3u8').write_text('/music/1.mp3\n/music/2.mp3\n', encoding='utf-8')
+        (self.root / 'sub' / 'b.M3U').write_text('/music/3.mp3\n', encoding='utf-8')
+        (self.root / 'empty.m3u8').write_text('', encoding='utf-8')
+        (self.root / 'notes.txt').write_text('/music/4.mp3\n', encoding='utf-8')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_load_playlist_parses_one_file(self):
+        pl = scanner.load_playlist(self.root / 'a.m3u8')
+        self.assertEqual(pl.name, 'a')
+        self.assertEqual(pl.tracks, [Path('/music/1.mp3'), Path('/music/2.mp3')])
+
+    def test_load_playlist_missing_or_empty(self):
+        self.assertIsNone(scanner.load_playlist(self.root / 'gone.m3u8'))
+        self.assertIsNone(scanner.load_playlist(self.root / 'empty.m3u8'))
+
+    def test_scan_recursive_and_flat(self):
+        names = lambda pls: sorted(pl.name for pl in pls)
+        self.assertEqual(names(scanner.scan_playlists(self.root)), ['a', 'b'])
+        self.assertEqual(names(scanner.scan_playlists(self.root, False)), ['a'])
+
+    @skipUnless(hasattr(os, 'symlink'), 'no symlinks')
+    def test_scan_does_not_follow_directory_symlink_loop(self):
+        try:
+            (self.root / 'sub' / 'loop').symlink_to('..', target_is_directory=True)
+        except OSError:
+            self.skipTest('symlinks not permitted')
+        names = sorted(pl.name for pl in scanner.scan_playlists(self.root))
+        self.assertEqual(names, ['a', 'b'])
+
+    def test_scan_single_file_and_missing_root(self):
+        self.assertEqual(len(scanner.scan_playlists(self.root / 'a.m3u8')), 1)
+        self.assertEqual(scanner.scan_playlists(self.root / 'nope'), [])
+
+    def test_write_m3u8_round_trips_extinf_titles(self):
+        p = self.root / 'new.m3u8'
+        scanner.write_m3u8(p, ['/music/1.mp3', '/music/2.mp3'], {'/music/2.mp3': 'Band – Song'})
+        self.assertTrue(p.read_text(encoding='utf-8').startswith('#EXTM3U\n'))
+        pl = scanner.load_playlist(p)
+        self.assertEqual(pl.tracks, [Path('/music/1.mp3'), Path('/music/2.mp3')])
+        self.assertEqual(pl.titles, {Path('/music/2.mp3'): 'Band – Song'})
+
+    def test_write_m3u8_keeps_multiline_title_on_one_line(self):
+        p = self.root / 'nl.m3u8'
+        scanner.write_m3u8(p, ['/music/1.mp3'], {'/music/1.mp3': 'Song\r\n/music/evil.mp3\rX'})
+        pl = scanner.load_playlist(p)
+        self.assertEqual(pl.tracks, [Path('/music/1.mp3')])
+        self.assertEqual(pl.titles, {Path('/music/1.mp3'): 'Song /music/evil.mp3 X'})
@@ -0,0 +1,70 @@
+import importlib, tempfile
+from pathlib import Path
+from unittest import TestCase
+
+storage = importlib.import_module('storage')
+
+class MetaCacheTests(TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._orig = storage.META_DB
+        storage.META_DB = Path(self._tmp.name) / 'meta.sqlite3'
+        storage._META_CONN = None
+
+    def tearDown(self):
+        if storage._META_CONN is not None:
+            storage._META_CONN.close()
+        storage._META_CONN = None
+        storage.META_DB = self._orig
+        self._tmp.cleanup()
+
+    def test_round_trip(self):
+        storage.meta_put([('/a.mp3', 1.5, 100, 'Song', 'Band', '/art/x.jpg')])
+        self.assertEqual(storage.meta_get(Path('/a.mp3'), 1.5, 100),
+                         ('Song', 'Band', '/art/x.jpg'))
+
+    def test_changed_file_misses(self):
+        storage.meta_put([('/a.mp3', 1.5, 100, 'Song', 'Band', None)])
+        self.assertIsNone(storage.meta_get(Path('/a.mp3'), 2.0, 100))
+        self.assertIsNone(storage.meta_get(Path('/a.mp3'), 1.5, 101))
+        self.assertIsNone(storage.meta_get(Path('/b.mp3'), 1.5, 100))
+
+    def test_tombstone_hits(self):
+        storage.meta_put([('/a.mp3', 1.5, 100, '', '', None)])
+        self.assertEqual(storage.meta_get(Path('/a.mp3'), 1.5, 100), ('', '', None))
+
+    def test_survives_reopen(self):
+        storage.meta_put([('/a.mp3', 1.5, 100, 'Song', 'Band', None)])
+        storage._META_CONN.close()
+        storage._META_CONN = None
+        self.assertEqual(storage.meta_get(Path('/a.mp3'), 1.5, 100)[0], 'Song')
+
+    def test_get_many_returns_only_fresh_hits(self):
+        storage.meta_put([(f'/{i}.mp3', 1.0, i, f'T{i}', '', None) for i in range(600)])
+        got = storage.meta_get_many([(Path(f'/{i}.mp3'), 1.0, i if i != 5 else 0)
+                                     for i in range(600)] + [(Path('/x.mp3'), 1.0, 1)])
+        self.assertEqual(len(got), 599)
+        self.assertNotIn('/5.mp3', got)
+        self.assertEqual(got['/599.mp3'], ('T599', '', None))
+
+class AsyncSaveTests(TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        d = Path(self._tmp.name)
+        self._orig = storage.STATE_FILE, storage.BAK_FILE
+        storage.STATE_FILE, storage.BAK_FILE = d / 'appstate.json', d / 'appstate.bak'
+
+    def tearDown(self):
+        storage.flush()
+        storage.STATE_FILE, storage.BAK_FILE = self._orig
+        self._tmp.cleanup()
+
+    def test_save_async_lands_after_flush(self):
+        storage.save_async({'theme': 'Dark'})
+        self.assertTrue(storage.flush(5))
+        self.assertEqual(storage._load_json(storage.STATE_FILE)['theme'], 'Dark')
+
+    def test_load_sees_latest_queued_state(self):
+        for i in range(5):
+            storage.save_async({'boost_gain': i})
+        self.assertEqual(storage.load()['boost_gain'], 4)
@@ -0,0 +1,75 @@
+import importlib, tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from mutagen.flac import FLAC, Picture
+from mutagen.id3 import ID3, TIT2, TPE1, APIC
+
+tags = importlib.import_module('tags')
+
+# minimal STREAMINFO so mutagen accepts the file
+_STREAMINFO = (b'\x00\x10\x00\x10' + b'\x00' * 6 + b'\x0a\xc4\x42\xf0'
+               + b'\x00' * 20)
+
+class ReadTagsTests(TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _mp3(self, version, title='Sóng', artist='Bänd'):
+        p = self.root / f'v{version}.mp3'
+        p.write_bytes(b'\xff\xfb\x90\x00' + b'\x00' * 400)
+        t = ID3()
+        if title:  t.add(TIT2(encoding=1, text=title))
+        if artist: t.add(TPE1(encoding=3, text=artist))
+        t.add(APIC(encoding=1, mime='image/png', type=3, desc='cövér', data=b'BIG' * 1000))
+        t.add(APIC(encoding=0, mime='image/jpeg', type=0, desc='x', data=b'small'))
+        t.save(p, v2_version=version)
+        return p
+
+    def test_id3_text_without_picture(self):
+        for v in (3, 4):
+            self.assertEqual(tags.read_tags(self._mp3(v)), ('Sóng', 'Bänd', None))
+
+    def test_id3_reads_largest_picture(self):
+        data, mime, ptype = tags.read_tags(self._mp3(4), want_picture=True)[2]
+        self.assertEqual((data, mime, ptype), (b'BIG' * 1000, 'image/png', 3))
+
+    def test_flac_comments_and_picture(self):
+        p = self.root / 'a.flac'
+        p.write_bytes(b'fLaC\x80\x00\x00\x22' + _STREAMINFO)
+        a = FLAC(p); a['title'] = 'T'; a['artist'] = 'A'
+        pic = Picture(); pic.type = 3; pic.mime = 'image/jpeg'; pic.data = b'J' * 500
+        a.add_picture(pic); a.save()
+        self.assertEqual(tags.read_tags(p, want_picture=True),
+                         ('T', 'A', (b'J' * 500, 'image/jpeg', 3)))
+
+    def test_unsupported_falls_back(self):
+        self.assertIsNone(tags.read_tags(self._mp3(4, title='', artist='')))
+        self.assertIsNone(tags.read_tags(self.root / 'gone.mp3'))
+        (self.root / 'x.ogg').write_bytes(b'OggS')
+        self.assertIsNone(tags.read_tags(self.root / 'x.ogg'))
+
+    def test_unterminated_apic_description_falls_back(self):
+        def frame(fid, body):
+            return fid + len(body).to_bytes(4, 'big') + b'\x00\x00' + body
+        body = (frame(b'TIT2', b'\x03Song') +
+                frame(b'APIC', b'\x01image/png\x00\x03' + b'\xff\xfea\x00b\x00' + b'PNG'))
+        size = len(body)
+        syncsafe = bytes((size >> s) & 0x7F for s in (21, 14, 7, 0))
+        p = self.root / 'bad.mp3'
+        p.write_bytes(b'ID3\x03\x00\x00' + syncsafe + body + b'\xff\xfb\x90\x00' + b'\x00' * 400)
+        self.assertEqual(tags.read_tags(p), ('Song', '', None))
+        self.assertIsNone(tags.read_tags(p, want_picture=True))
+
+    def test_corrupt_vorbis_comment_count_falls_back(self):
+        vendor = b'x'
+        block = (len(vendor).to_bytes(4, 'little') + vendor + (0xFFFFFFF0).to_bytes(4, 'little')
+                 + (7).to_bytes(4, 'little') + b'TITLE=T')
+        p = self.root / 'bad.flac'
+        p.write_bytes(b'fLaC\x00\x00\x00\x22' + _STREAMINFO
+                      + b'\x84' + len(block).to_bytes(3, 'big') + block)
+        self.assertIsNone(tags.read_tags(p))